@@ -21,6 +21,9 @@ import pytest
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.test import override_settings
 
 from factories import (
     UserFactory,
@@ -52,10 +55,54 @@ def django_db_setup(django_db_setup, django_db_blocker):
     
     This fixture ensures the test database is properly set up.
     Pytest-django handles most of this automatically, but we can customize here.
+    Migrations are skipped via ``--nomigrations`` in pytest.ini, which builds the
+    schema straight from the models.
     """
     pass
 
 
+@pytest.fixture(scope='module')
+def module_savepoint(django_db_setup, django_db_blocker):
+    """
+    Wrap a whole test module in one outer transaction.
+    
+    Module-scoped data fixtures build their rows inside it, and everything is
+    rolled back once the module finishes. Class- and test-level atomics nest
+    inside as savepoints, so this must be the outermost transaction of any
+    module that uses it.
+    """
+    with django_db_blocker.unblock():
+        with transaction.atomic():
+            yield
+            transaction.set_rollback(True)
+
+
+@pytest.fixture(autouse=True, scope='session')
+def fast_password_hasher():
+    """
+    Use the MD5 password hasher for the whole test session.
+    
+    The default PBKDF2 hasher runs hundreds of thousands of iterations per
+    ``set_password()``, which dominates the cost of every UserFactory call.
+    Tests never rely on hash strength, so a single MD5 round is enough.
+    """
+    with override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Empty the cache after each test.
+    
+    Database rows are rolled back between tests but cached values are not,
+    and primary keys are reused, so e.g. cached notification counts for
+    user 1 would leak into the next test.
+    """
+    yield
+    cache.clear()
+
+
 # ============================================================================
 # User Fixtures
 # ============================================================================
@@ -200,6 +247,31 @@ def team_with_members(db):
     return team, owner, admin, member
 
 
+@pytest.fixture(scope='module')
+def shared_team_with_members(module_savepoint, django_db_blocker):
+    """
+    Module-scoped variant of ``team_with_members``.
+    
+    Built once per module instead of once per test. Tests must treat it as
+    read-only: changes made inside a test are rolled back with the test's
+    savepoint, but the returned instances are not refreshed.
+    
+    Returns:
+        tuple: (team, owner, admin, member) - Team and three members with different roles
+    """
+    with django_db_blocker.unblock():
+        team = TeamFactory()
+        owner = UserFactory()
+        admin = UserFactory()
+        member = UserFactory()
+        
+        TeamMemberFactory(team=team, user=owner, role='owner')
+        TeamMemberFactory(team=team, user=admin, role='admin')
+        TeamMemberFactory(team=team, user=member, role='member')
+    
+    return team, owner, admin, member
+
+
 # ============================================================================
 # Project Fixtures
 # ============================================================================
@@ -249,6 +321,27 @@ def project_with_members(db, team_with_members):
     return project, team_owner, team_admin, team_member
 
 
+@pytest.fixture(scope='module')
+def shared_project_with_members(shared_team_with_members, django_db_blocker):
+    """
+    Module-scoped variant of ``project_with_members``.
+    
+    Same read-only contract as ``shared_team_with_members``.
+    
+    Returns:
+        tuple: (project, owner, admin, member) - Project and three members with different roles
+    """
+    team, team_owner, team_admin, team_member = shared_team_with_members
+    with django_db_blocker.unblock():
+        project = ProjectFactory(team=team)
+        
+        ProjectMemberFactory(project=project, user=team_owner, role='owner')
+        ProjectMemberFactory(project=project, user=team_admin, role='admin')
+        ProjectMemberFactory(project=project, user=team_member, role='member')
+    
+    return project, team_owner, team_admin, team_member
+
+
 # ============================================================================
 # Task Fixtures
 # ============================================================================
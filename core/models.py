@@ -5,6 +5,10 @@ This module defines core models that are used across the application,
 such as ActivityLog for tracking user activities.
 """
 
+import time
+from functools import lru_cache
+from types import MappingProxyType
+
 from django.db import models
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -13,6 +17,17 @@ from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 
 
+@lru_cache(maxsize=None)
+def _content_type_for(model_cls):
+    """
+    Return the ContentType for a model class, memoized per class.
+    
+    ContentType rows are only recreated by migrate/flush, which clear this
+    cache through the post_migrate receiver in core.signals.
+    """
+    return ContentType.objects.get_for_model(model_cls)
+
+
 class ActivityLog(models.Model):
     """
     ActivityLog model for tracking user activities across the system.
@@ -190,7 +205,7 @@ class ActivityLog(models.Model):
                 user_agent=user_agent,
             )
         else:
-            content_type = ContentType.objects.get_for_model(obj.__class__)
+            content_type = _content_type_for(obj.__class__)
             log = cls.objects.create(
                 user=user,
                 action=action,
@@ -234,23 +249,7 @@ class ActivityLog(models.Model):
         Returns:
             str: CSS class name for action
         """
-        action_classes = {
-            self.ACTION_CREATED: 'created',
-            self.ACTION_UPDATED: 'updated',
-            self.ACTION_DELETED: 'deleted',
-            self.ACTION_VIEWED: 'viewed',
-            self.ACTION_ASSIGNED: 'assigned',
-            self.ACTION_UNASSIGNED: 'unassigned',
-            self.ACTION_STATUS_CHANGED: 'status-changed',
-            self.ACTION_PRIORITY_CHANGED: 'priority-changed',
-            self.ACTION_MEMBER_ADDED: 'member-added',
-            self.ACTION_MEMBER_REMOVED: 'member-removed',
-            self.ACTION_COMMENT_ADDED: 'comment-added',
-            self.ACTION_ATTACHMENT_ADDED: 'attachment-added',
-            self.ACTION_LOGIN: 'login',
-            self.ACTION_LOGOUT: 'logout',
-        }
-        return action_classes.get(self.action, '')
+        return _ACTION_CLASSES.get(self.action, '')
     
     def get_icon(self):
         """
@@ -259,23 +258,19 @@ class ActivityLog(models.Model):
         Returns:
             str: Icon name for the action
         """
-        icon_map = {
-            self.ACTION_CREATED: 'plus-circle',
-            self.ACTION_UPDATED: 'edit',
-            self.ACTION_DELETED: 'trash',
-            self.ACTION_VIEWED: 'eye',
-            self.ACTION_ASSIGNED: 'user-plus',
-            self.ACTION_UNASSIGNED: 'user-minus',
-            self.ACTION_STATUS_CHANGED: 'arrow-right',
-            self.ACTION_PRIORITY_CHANGED: 'flag',
-            self.ACTION_MEMBER_ADDED: 'user-plus',
-            self.ACTION_MEMBER_REMOVED: 'user-minus',
-            self.ACTION_COMMENT_ADDED: 'message-square',
-            self.ACTION_ATTACHMENT_ADDED: 'paperclip',
-            self.ACTION_LOGIN: 'log-in',
-            self.ACTION_LOGOUT: 'log-out',
-        }
-        return icon_map.get(self.action, 'activity')
+        return _ACTION_ICONS.get(self.action, 'activity')
+    
+    def _get_age_in_seconds(self):
+        """
+        Get the age of this activity log in seconds.
+        
+        Works on epoch floats instead of building an aware ``now`` and a
+        timedelta for every call.
+        
+        Returns:
+            float: Number of seconds since the activity was logged
+        """
+        return time.time() - self.timestamp.timestamp()
     
     def get_age_in_days(self):
         """
@@ -284,8 +279,7 @@ class ActivityLog(models.Model):
         Returns:
             int: Number of days since the activity was logged
         """
-        time_diff = timezone.now() - self.timestamp
-        return time_diff.days
+        return int(self._get_age_in_seconds() // 86400)
     
     def get_age_in_hours(self):
         """
@@ -294,8 +288,7 @@ class ActivityLog(models.Model):
         Returns:
             float: Number of hours since the activity was logged
         """
-        time_diff = timezone.now() - self.timestamp
-        return time_diff.total_seconds() / 3600
+        return self._get_age_in_seconds() / 3600
     
     def is_recent(self, hours=24):
         """
@@ -341,8 +334,45 @@ class ActivityLog(models.Model):
         Returns:
             QuerySet: ActivityLog instances for the object
         """
-        content_type = ContentType.objects.get_for_model(obj.__class__)
+        content_type = _content_type_for(obj.__class__)
         return cls.objects.filter(
             content_type=content_type,
             object_id=obj.pk
         )
+
+
+# Read-only action -> CSS class map, built once instead of on every call
+_ACTION_CLASSES = MappingProxyType({
+    ActivityLog.ACTION_CREATED: 'created',
+    ActivityLog.ACTION_UPDATED: 'updated',
+    ActivityLog.ACTION_DELETED: 'deleted',
+    ActivityLog.ACTION_VIEWED: 'viewed',
+    ActivityLog.ACTION_ASSIGNED: 'assigned',
+    ActivityLog.ACTION_UNASSIGNED: 'unassigned',
+    ActivityLog.ACTION_STATUS_CHANGED: 'status-changed',
+    ActivityLog.ACTION_PRIORITY_CHANGED: 'priority-changed',
+    ActivityLog.ACTION_MEMBER_ADDED: 'member-added',
+    ActivityLog.ACTION_MEMBER_REMOVED: 'member-removed',
+    ActivityLog.ACTION_COMMENT_ADDED: 'comment-added',
+    ActivityLog.ACTION_ATTACHMENT_ADDED: 'attachment-added',
+    ActivityLog.ACTION_LOGIN: 'login',
+    ActivityLog.ACTION_LOGOUT: 'logout',
+})
+
+# Read-only action -> icon name map, built once instead of on every call
+_ACTION_ICONS = MappingProxyType({
+    ActivityLog.ACTION_CREATED: 'plus-circle',
+    ActivityLog.ACTION_UPDATED: 'edit',
+    ActivityLog.ACTION_DELETED: 'trash',
+    ActivityLog.ACTION_VIEWED: 'eye',
+    ActivityLog.ACTION_ASSIGNED: 'user-plus',
+    ActivityLog.ACTION_UNASSIGNED: 'user-minus',
+    ActivityLog.ACTION_STATUS_CHANGED: 'arrow-right',
+    ActivityLog.ACTION_PRIORITY_CHANGED: 'flag',
+    ActivityLog.ACTION_MEMBER_ADDED: 'user-plus',
+    ActivityLog.ACTION_MEMBER_REMOVED: 'user-minus',
+    ActivityLog.ACTION_COMMENT_ADDED: 'message-square',
+    ActivityLog.ACTION_ATTACHMENT_ADDED: 'paperclip',
+    ActivityLog.ACTION_LOGIN: 'log-in',
+    ActivityLog.ACTION_LOGOUT: 'log-out',
+})
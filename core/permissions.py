@@ -370,5 +370,5 @@ class IsTaskAssigneeOnly(permissions.BasePermission):
             raise PermissionDenied("This permission can only be used with Task objects.")
         
         # Only check if user is assigned to the task (strict check)
-        return obj.assignee and obj.assignee == request.user
+        return obj.assignee is not None and obj.assignee == request.user
 
@@ -0,0 +1,40 @@
+"""
+Renderers for Task Management System.
+
+This module provides response renderers used by specific views where the
+default DRF renderers are too slow for the call volume involved.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+    
+    orjson is implemented in C and returns bytes directly, which makes it
+    considerably cheaper than the stdlib-based JSONRenderer. It is used on
+    the health endpoints only, since those are polled far more often than
+    any user-facing endpoint.
+    """
+    
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Serialize data to JSON bytes.
+        
+        Args:
+            data: Data to serialize
+            accepted_media_type: Negotiated media type (unused)
+            renderer_context: Renderer context (unused)
+            
+        Returns:
+            bytes: JSON-encoded data, or empty bytes if data is None
+        """
+        if data is None:
+            return b''
+        return orjson.dumps(data)
@@ -5,10 +5,10 @@ This module contains Django signals for automatically logging user activities
 when models are created, updated, or deleted.
 """
 
-from django.db.models.signals import post_save, post_delete, pre_save
+from django.db.models.signals import post_save, post_delete, pre_save, post_migrate
 from django.dispatch import receiver
 from django.contrib.contenttypes.models import ContentType
-from .models import ActivityLog
+from .models import ActivityLog, _content_type_for
 
 
 # Store original instance before save for detecting changes
@@ -447,3 +447,8 @@ def log_project_member_removal(sender, instance, **kwargs):
         }
     )
 
+
+@receiver(post_migrate)
+def clear_content_type_cache(sender, **kwargs):
+    """Drop memoized ContentTypes after migrate/flush may have recreated them."""
+    _content_type_for.cache_clear()
@@ -7,31 +7,105 @@ This module contains tests for:
 - Permission classes (if needed)
 """
 
+import threading
+import time
 import pytest
+import redis
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
-from django.test import RequestFactory
-from django.db import connection
-from django.conf import settings
+from django.test import RequestFactory, override_settings
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from django.db import connection, transaction
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 from datetime import timedelta
 
 from core.views import (
-    health_check,  # Backward compatibility
     HealthCheckView,
     DatabaseHealthCheckView,
     RedisHealthCheckView,
+    _HEALTH_CACHE,
+    _PROBE_STATE,
+    _utc_iso_now,
 )
 from core.models import ActivityLog
+from users.models import User
+from tasks.models import Task
+from core.permissions import IsTeamMember, IsProjectMember, IsTaskAssignee, IsTaskAssigneeOnly
 from factories import UserFactory, TaskFactory, ProjectFactory, TeamFactory
 
 
+# Permission classes hold no per-instance state, so one instance each is shared
+_IS_TEAM_MEMBER = IsTeamMember()
+_IS_PROJECT_MEMBER = IsProjectMember()
+_IS_TASK_ASSIGNEE = IsTaskAssignee()
+_IS_TASK_ASSIGNEE_ONLY = IsTaskAssigneeOnly()
+
+_PERMISSIONS = {
+    IsTeamMember: _IS_TEAM_MEMBER,
+    IsProjectMember: _IS_PROJECT_MEMBER,
+    IsTaskAssignee: _IS_TASK_ASSIGNEE,
+    IsTaskAssigneeOnly: _IS_TASK_ASSIGNEE_ONLY,
+}
+
+# Request factory and view are stateless as well
+_FACTORY = APIRequestFactory()
+_VIEW = APIView()
+
+
+@pytest.fixture(scope='class')
+def class_savepoint(module_savepoint, django_db_blocker):
+    """
+    Wrap a whole test class in one savepoint.
+    
+    Per-test ``django_db`` atomics nest inside it, so the class pays for a
+    single savepoint instead of one transaction per test, and rows created
+    by class-scoped fixtures are discarded when the class finishes. It sits
+    inside ``module_savepoint`` so module-scoped fixtures stay outermost.
+    """
+    with django_db_blocker.unblock():
+        with transaction.atomic():
+            yield
+            transaction.set_rollback(True)
+
+
+@pytest.fixture(scope='class')
+def class_user(class_savepoint, django_db_blocker):
+    """
+    User shared by every test in a class (pytest analogue of setUpTestData).
+    
+    Tests must treat it as read-only; per-test changes are rolled back with
+    the test's savepoint but the instance itself is not refreshed.
+    """
+    with django_db_blocker.unblock():
+        return UserFactory()
+
+
 # ============================================================================
 # Health Check View Tests
 # ============================================================================
 
+@pytest.fixture
+def clear_health_cache():
+    """Start each test with an empty /health/ result cache."""
+    _HEALTH_CACHE.update(ts=0.0, body=None, status=None, inflight=None)
+    yield
+    _HEALTH_CACHE.update(ts=0.0, body=None, status=None, inflight=None)
+
+
+@pytest.fixture
+def reset_probe_state():
+    """Start each test with no recorded probe outcomes."""
+    _PROBE_STATE.update(dict.fromkeys(_PROBE_STATE))
+    yield
+    _PROBE_STATE.update(dict.fromkeys(_PROBE_STATE))
+
+
 @pytest.mark.django_db
 @pytest.mark.view
+@pytest.mark.usefixtures('clear_health_cache')
 class TestHealthCheckView:
     """Test suite for comprehensive health check endpoint."""
     
@@ -49,6 +123,11 @@ class TestHealthCheckView:
         assert 'timestamp' in data
         assert 'version' in data
     
+    def test_health_check_timestamp_has_real_microseconds(self):
+        """Test the timestamp carries the actual sub-second part of the clock."""
+        with patch('core.views.time.time_ns', return_value=1705314645_123456789):
+            assert _utc_iso_now() == '2024-01-15T10:30:45.123456Z'
+    
     def test_health_check_database_unhealthy(self, api_client):
         """Test health check when database is unhealthy."""
         with patch.object(connection, 'cursor') as mock_cursor:
@@ -63,14 +142,42 @@ class TestHealthCheckView:
             assert data['services']['database']['status'] == 'unhealthy'
             assert 'error' in data['services']['database']
     
+    def test_health_check_database_uses_ping_on_mysql(self):
+        """Test the MySQL probe uses the driver ping instead of a cursor."""
+        with patch.object(connection, 'vendor', 'mysql'), \
+                patch.object(connection, 'connection') as mock_raw, \
+                patch.object(connection, 'cursor') as mock_cursor:
+            result = HealthCheckView()._check_database()
+        
+        assert result['status'] == 'healthy'
+        mock_raw.ping.assert_called_once_with()
+        mock_cursor.assert_not_called()
+    
+    def test_health_check_database_ping_error_recovers(self):
+        """Test a driver-level ping error is reported and the next probe recovers."""
+        driver_error = connection.Database.OperationalError("MySQL server has gone away")
+        with patch.object(connection, 'vendor', 'mysql'), \
+                patch.object(connection, 'errors_occurred', False), \
+                patch.object(connection, 'connection') as mock_raw:
+            mock_raw.ping.side_effect = [driver_error, None]
+            
+            failed = HealthCheckView()._check_database()
+            assert connection.errors_occurred
+            recovered = HealthCheckView()._check_database()
+        
+        assert failed['status'] == 'unhealthy'
+        assert 'gone away' in failed['error']
+        assert recovered['status'] == 'healthy'
+        assert mock_raw.ping.call_count == 2
+    
     def test_health_check_redis_healthy(self, api_client):
         """Test health check when Redis is healthy."""
-        with patch('core.views.redis') as mock_redis:
+        with patch('core.views._get_redis_client') as mock_get_client:
             mock_client = MagicMock()
             mock_client.ping.return_value = True
-            mock_redis.from_url.return_value = mock_client
+            mock_get_client.return_value = mock_client
             
-            with patch.object(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379/0'):
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
                 response = api_client.get('/health/')
                 
                 assert response.status_code == 200
@@ -81,13 +188,13 @@ class TestHealthCheckView:
     
     def test_health_check_redis_unhealthy(self, api_client):
         """Test health check when Redis is unhealthy."""
-        with patch('core.views.redis') as mock_redis:
+        with patch('core.views._get_redis_client') as mock_get_client:
             mock_client = MagicMock()
             mock_client.ping.side_effect = Exception("Redis connection failed")
-            mock_redis.from_url.return_value = mock_client
+            mock_get_client.return_value = mock_client
             
-            with patch.object(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379/0'):
-                with patch.object(settings, 'DEBUG', False):  # In production, Redis failure makes it unhealthy
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
+                with override_settings(DEBUG=False):  # In production, Redis failure makes it unhealthy
                     response = api_client.get('/health/')
                     
                     assert response.status_code == 503
@@ -99,7 +206,7 @@ class TestHealthCheckView:
     
     def test_health_check_redis_not_configured(self, api_client):
         """Test health check when Redis is not configured."""
-        with patch.object(settings, 'CELERY_BROKER_URL', None):
+        with override_settings(CELERY_BROKER_URL=None):
             response = api_client.get('/health/')
             
             assert response.status_code == 200
@@ -109,13 +216,13 @@ class TestHealthCheckView:
     
     def test_health_check_redis_unhealthy_in_debug_mode(self, api_client):
         """Test health check when Redis is unhealthy but DEBUG=True (should not fail)."""
-        with patch('core.views.redis') as mock_redis:
+        with patch('core.views._get_redis_client') as mock_get_client:
             mock_client = MagicMock()
             mock_client.ping.side_effect = Exception("Redis connection failed")
-            mock_redis.from_url.return_value = mock_client
+            mock_get_client.return_value = mock_client
             
-            with patch.object(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379/0'):
-                with patch.object(settings, 'DEBUG', True):  # In debug mode, Redis failure doesn't fail health check
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
+                with override_settings(DEBUG=True):  # In debug mode, Redis failure doesn't fail health check
                     response = api_client.get('/health/')
                     
                     # Should still return 200 in debug mode even if Redis fails
@@ -142,6 +249,41 @@ class TestHealthCheckView:
         # api_client is unauthenticated by default
         response = api_client.get('/health/')
         assert response.status_code == 200
+    
+    def test_health_check_cached_within_ttl(self, api_client):
+        """Test that a repeat probe within the TTL reuses the previous result."""
+        first = api_client.get('/health/')
+        assert 'cached' not in first.data
+        
+        with patch.object(HealthCheckView, '_check_database') as mock_check:
+            second = api_client.get('/health/')
+        
+        mock_check.assert_not_called()
+        assert second.status_code == first.status_code
+        # Cache hits return pre-serialized JSON rather than a DRF Response
+        assert second['Content-Type'] == 'application/json'
+        cached = second.json()
+        assert cached['cached'] is True
+        assert cached['services'] == first.data['services']
+    
+    def test_health_check_waits_for_inflight_probe(self, api_client):
+        """Test that a miss during an in-flight probe reuses its result."""
+        inflight = threading.Event()
+        _HEALTH_CACHE['inflight'] = inflight
+        
+        def finish_probe():
+            _HEALTH_CACHE.update(ts=time.monotonic(), body=b'{"status":"healthy"}', status=200)
+            inflight.set()
+        
+        timer = threading.Timer(0.05, finish_probe)
+        timer.start()
+        with patch.object(HealthCheckView, '_check_database') as mock_check:
+            response = api_client.get('/health/')
+        timer.join()
+        
+        mock_check.assert_not_called()
+        assert response.status_code == 200
+        assert response.json() == {'status': 'healthy'}
 
 
 @pytest.mark.django_db
@@ -190,6 +332,20 @@ class TestDatabaseHealthCheckView:
         assert 'host' in db_info
         assert 'port' in db_info
     
+    def test_database_health_check_single_query_on_mysql(self, api_client):
+        """Test the MySQL probe gathers everything in one statement."""
+        with patch.object(connection, 'vendor', 'mysql'), \
+                patch.object(connection, 'cursor') as mock_cursor:
+            cursor = mock_cursor.return_value.__enter__.return_value
+            cursor.fetchone.return_value = (1, 'taskmanager', 42)
+            
+            response = api_client.get('/health/db/')
+        
+        assert response.status_code == 200
+        cursor.execute.assert_called_once_with("SELECT 1, DATABASE(), CONNECTION_ID()")
+        assert response.data['database']['actual_database'] == 'taskmanager'
+        assert response.data['database']['connection_id'] == 42
+    
     def test_database_health_check_response_time(self, api_client):
         """Test that database health check includes response time."""
         response = api_client.get('/health/db/')
@@ -213,16 +369,15 @@ class TestRedisHealthCheckView:
     
     def test_redis_health_check_healthy(self, api_client):
         """Test Redis health check when Redis is healthy."""
-        with patch('core.views.redis') as mock_redis:
+        with patch('core.views._get_redis_client') as mock_get_client:
             mock_client = MagicMock()
-            mock_client.ping.return_value = True
-            mock_client.info.return_value = {
+            mock_client.pipeline.return_value.execute.return_value = [True, {
                 'redis_version': '7.0.0',
                 'connected_clients': 5,
-            }
-            mock_redis.from_url.return_value = mock_client
+            }]
+            mock_get_client.return_value = mock_client
             
-            with patch.object(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379/0'):
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
                 response = api_client.get('/health/redis/')
                 
                 assert response.status_code == 200
@@ -235,12 +390,10 @@ class TestRedisHealthCheckView:
     
     def test_redis_health_check_unhealthy_connection_error(self, api_client):
         """Test Redis health check when Redis connection fails."""
-        import redis
-        
-        with patch('core.views.redis') as mock_redis:
-            mock_redis.from_url.side_effect = redis.ConnectionError("Connection refused")
+        with patch('core.views._get_redis_client') as mock_get_client:
+            mock_get_client.return_value.pipeline.return_value.execute.side_effect = redis.ConnectionError("Connection refused")
             
-            with patch.object(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379/0'):
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
                 response = api_client.get('/health/redis/')
                 
                 assert response.status_code == 503
@@ -252,14 +405,12 @@ class TestRedisHealthCheckView:
     
     def test_redis_health_check_unhealthy_timeout(self, api_client):
         """Test Redis health check when Redis times out."""
-        import redis
-        
-        with patch('core.views.redis') as mock_redis:
+        with patch('core.views._get_redis_client') as mock_get_client:
             mock_client = MagicMock()
-            mock_client.ping.side_effect = redis.TimeoutError("Timeout")
-            mock_redis.from_url.return_value = mock_client
+            mock_client.pipeline.return_value.execute.side_effect = redis.TimeoutError("Timeout")
+            mock_get_client.return_value = mock_client
             
-            with patch.object(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379/0'):
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
                 response = api_client.get('/health/redis/')
                 
                 assert response.status_code == 503
@@ -270,7 +421,7 @@ class TestRedisHealthCheckView:
     
     def test_redis_health_check_not_configured(self, api_client):
         """Test Redis health check when Redis is not configured."""
-        with patch.object(settings, 'CELERY_BROKER_URL', None):
+        with override_settings(CELERY_BROKER_URL=None):
             response = api_client.get('/health/redis/')
             
             assert response.status_code == 503
@@ -281,16 +432,15 @@ class TestRedisHealthCheckView:
     
     def test_redis_health_check_includes_server_info(self, api_client):
         """Test that Redis health check includes server info when available."""
-        with patch('core.views.redis') as mock_redis:
+        with patch('core.views._get_redis_client') as mock_get_client:
             mock_client = MagicMock()
-            mock_client.ping.return_value = True
-            mock_client.info.return_value = {
+            mock_client.pipeline.return_value.execute.return_value = [True, {
                 'redis_version': '7.0.0',
                 'connected_clients': 5,
-            }
-            mock_redis.from_url.return_value = mock_client
+            }]
+            mock_get_client.return_value = mock_client
             
-            with patch.object(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379/0'):
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
                 response = api_client.get('/health/redis/')
                 
                 assert response.status_code == 200
@@ -299,14 +449,68 @@ class TestRedisHealthCheckView:
                 assert 'redis_version' in data['redis']['server_info']
                 assert 'connected_clients' in data['redis']['server_info']
     
+    def test_redis_health_check_single_round_trip(self, api_client):
+        """Test PING and INFO are sent together in one non-transactional pipeline."""
+        with patch('core.views._get_redis_client') as mock_get_client:
+            mock_client = MagicMock()
+            pipe = mock_client.pipeline.return_value
+            pipe.execute.return_value = [True, {}]
+            mock_get_client.return_value = mock_client
+            
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
+                response = api_client.get('/health/redis/')
+        
+        assert response.status_code == 200
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.ping.assert_called_once_with()
+        pipe.info.assert_called_once_with('server')
+        pipe.execute.assert_called_once()
+    
+    def test_redis_health_check_info_failure_still_healthy(self, api_client):
+        """Test a failed INFO reply drops server_info but keeps Redis healthy."""
+        with patch('core.views._get_redis_client') as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.pipeline.return_value.execute.return_value = [
+                True, redis.ResponseError('unknown command'),
+            ]
+            mock_get_client.return_value = mock_client
+            
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
+                response = api_client.get('/health/redis/')
+        
+        assert response.status_code == 200
+        assert 'server_info' not in response.data['redis']
+    
+    @pytest.mark.usefixtures('reset_probe_state')
+    def test_redis_health_check_logs_only_on_transition(self, api_client, caplog):
+        """Test that repeated failures log one warning and recovery logs once."""
+        with patch('core.views._get_redis_client') as mock_get_client:
+            execute = mock_get_client.return_value.pipeline.return_value.execute
+            execute.side_effect = redis.ConnectionError('Connection refused')
+            
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
+                with caplog.at_level('INFO', logger='core.views'):
+                    api_client.get('/health/redis/')
+                    api_client.get('/health/redis/')
+                    execute.side_effect = None
+                    execute.return_value = [True, {}]
+                    api_client.get('/health/redis/')
+                    api_client.get('/health/redis/')
+        
+        messages = [(r.levelname, r.getMessage()) for r in caplog.records if r.name == 'core.views']
+        assert messages == [
+            ('WARNING', 'Redis health check failed: Connection error'),
+            ('INFO', 'Redis health check recovered'),
+        ]
+    
     def test_redis_health_check_response_time(self, api_client):
         """Test that Redis health check includes response time."""
-        with patch('core.views.redis') as mock_redis:
+        with patch('core.views._get_redis_client') as mock_get_client:
             mock_client = MagicMock()
-            mock_client.ping.return_value = True
-            mock_redis.from_url.return_value = mock_client
+            mock_client.pipeline.return_value.execute.return_value = [True, {}]
+            mock_get_client.return_value = mock_client
             
-            with patch.object(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379/0'):
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
                 response = api_client.get('/health/redis/')
                 
                 assert response.status_code == 200
@@ -317,31 +521,60 @@ class TestRedisHealthCheckView:
     
     def test_redis_health_check_no_authentication_required(self, api_client):
         """Test that Redis health check doesn't require authentication."""
-        with patch('core.views.redis') as mock_redis:
+        with patch('core.views._get_redis_client') as mock_get_client:
             mock_client = MagicMock()
-            mock_client.ping.return_value = True
-            mock_redis.from_url.return_value = mock_client
+            mock_client.pipeline.return_value.execute.return_value = [True, {}]
+            mock_get_client.return_value = mock_client
             
-            with patch.object(settings, 'CELERY_BROKER_URL', 'redis://localhost:6379/0'):
+            with override_settings(CELERY_BROKER_URL='redis://localhost:6379/0'):
                 response = api_client.get('/health/redis/')
                 assert response.status_code == 200
 
 
+@pytest.mark.view
+class TestLivenessView:
+    """Test suite for the dependency-free liveness endpoint."""
+    
+    def test_liveness_returns_ok(self, api_client):
+        """Test liveness probe returns the constant payload."""
+        response = api_client.get('/health/live/')
+        
+        assert response.status_code == 200
+        assert response.data == {'status': 'ok'}
+    
+    def test_liveness_skips_dependency_checks(self, api_client):
+        """Test liveness probe never touches the database or Redis."""
+        # No django_db marker: any database access would fail the test
+        with patch('core.views._get_redis_client') as mock_get_client:
+            response = api_client.get('/health/live/')
+        
+        assert response.status_code == 200
+        mock_get_client.assert_not_called()
+    
+    def test_liveness_ignores_invalid_credentials(self, api_client):
+        """Test probes skip authentication, so a bad token is not a 401."""
+        api_client.credentials(HTTP_AUTHORIZATION='Bearer not-a-valid-token')
+        response = api_client.get('/health/live/')
+        
+        assert response.status_code == 200
+
+
 # Backward compatibility tests for function-based view
 @pytest.mark.django_db
 @pytest.mark.view
-class TestHealthCheckFunctionView:
-    """Test suite for backward-compatible function-based health check."""
+@pytest.mark.usefixtures('clear_health_cache')
+class TestHealthCheckAsView:
+    """Test suite for calling HealthCheckView outside the URLconf."""
     
-    def test_health_check_function_all_healthy(self):
-        """Test function-based health check when all services are healthy."""
+    def test_health_check_as_view_all_healthy(self):
+        """Test the as_view() callable when all services are healthy."""
         factory = RequestFactory()
         request = factory.get('/health/')
         
-        response = health_check(request)
+        response = HealthCheckView.as_view()(request)
         
         assert response.status_code == 200
-        data = response.json()
+        data = response.data
         assert data['status'] == 'healthy'
         assert 'services' in data
 
@@ -350,14 +583,22 @@ class TestHealthCheckFunctionView:
 # ActivityLog Model Tests
 # ============================================================================
 
-@pytest.mark.django_db
+@pytest.fixture(scope='session')
+def task_content_type(django_db_setup, django_db_blocker):
+    """Resolve the Task ContentType once for the whole test session."""
+    with django_db_blocker.unblock():
+        return ContentType.objects.get_for_model(Task)
+
+
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.model
+@pytest.mark.usefixtures('class_savepoint')
 class TestActivityLogModel:
     """Test suite for ActivityLog model."""
     
-    def test_activity_log_creation(self):
+    def test_activity_log_creation(self, class_user):
         """Test basic activity log creation."""
-        user = UserFactory()
+        user = class_user
         log = ActivityLog.objects.create(
             user=user,
             action=ActivityLog.ACTION_CREATED,
@@ -369,18 +610,6 @@ class TestActivityLogModel:
         assert log.metadata == {'test': 'data'}
         assert log.pk is not None
     
-    def test_activity_log_str_representation(self):
-        """Test string representation of ActivityLog."""
-        user = UserFactory(username='testuser')
-        log = ActivityLog.objects.create(
-            user=user,
-            action=ActivityLog.ACTION_CREATED
-        )
-        
-        str_repr = str(log)
-        assert 'testuser' in str_repr
-        assert 'Created' in str_repr
-    
     def test_activity_log_without_user(self):
         """Test activity log creation without user."""
         log = ActivityLog.objects.create(
@@ -391,9 +620,9 @@ class TestActivityLogModel:
         assert log.user is None
         assert log.action == ActivityLog.ACTION_CREATED
     
-    def test_activity_log_with_related_object(self):
+    def test_activity_log_with_related_object(self, task_content_type, class_user):
         """Test activity log with related object using GenericForeignKey."""
-        user = UserFactory()
+        user = class_user
         task = TaskFactory()
         
         log = ActivityLog.log_activity(
@@ -404,12 +633,12 @@ class TestActivityLogModel:
         
         assert log.user == user
         assert log.content_object == task
-        assert log.content_type == ContentType.objects.get_for_model(task.__class__)
+        assert log.content_type == task_content_type
         assert log.object_id == task.pk
     
-    def test_activity_log_without_related_object(self):
+    def test_activity_log_without_related_object(self, class_user):
         """Test activity log creation without related object."""
-        user = UserFactory()
+        user = class_user
         
         log = ActivityLog.log_activity(
             user=user,
@@ -421,9 +650,9 @@ class TestActivityLogModel:
         assert log.content_type is None
         assert log.object_id is None
     
-    def test_activity_log_with_metadata(self):
+    def test_activity_log_with_metadata(self, class_user):
         """Test activity log with metadata."""
-        user = UserFactory()
+        user = class_user
         metadata = {'key': 'value', 'number': 123}
         
         log = ActivityLog.log_activity(
@@ -434,9 +663,9 @@ class TestActivityLogModel:
         
         assert log.metadata == metadata
     
-    def test_activity_log_with_ip_and_user_agent(self):
+    def test_activity_log_with_ip_and_user_agent(self, class_user):
         """Test activity log with IP address and user agent."""
-        user = UserFactory()
+        user = class_user
         
         log = ActivityLog.log_activity(
             user=user,
@@ -448,9 +677,9 @@ class TestActivityLogModel:
         assert log.ip_address == '192.168.1.1'
         assert log.user_agent == 'Mozilla/5.0'
     
-    def test_get_object_display_with_object(self):
+    def test_get_object_display_with_object(self, class_user):
         """Test get_object_display when object exists."""
-        user = UserFactory()
+        user = class_user
         task = TaskFactory()
         
         log = ActivityLog.log_activity(
@@ -462,9 +691,9 @@ class TestActivityLogModel:
         display = log.get_object_display()
         assert str(task) in display or task.title in display
     
-    def test_get_object_display_without_object(self):
+    def test_get_object_display_without_object(self, class_user):
         """Test get_object_display when object doesn't exist."""
-        user = UserFactory()
+        user = class_user
         
         log = ActivityLog.log_activity(
             user=user,
@@ -474,59 +703,9 @@ class TestActivityLogModel:
         display = log.get_object_display()
         assert display == 'Unknown Object'
     
-    def test_get_user_display_with_user(self):
-        """Test get_user_display when user exists."""
-        user = UserFactory(username='testuser')
-        log = ActivityLog.objects.create(
-            user=user,
-            action=ActivityLog.ACTION_CREATED
-        )
-        
-        assert log.get_user_display() == 'testuser'
-    
-    def test_get_user_display_without_user(self):
-        """Test get_user_display when user is None."""
-        log = ActivityLog.objects.create(
-            action=ActivityLog.ACTION_CREATED
-        )
-        
-        assert log.get_user_display() == 'System'
-    
-    def test_get_action_display_class(self):
-        """Test get_action_display_class returns correct CSS class."""
-        user = UserFactory()
-        log = ActivityLog.objects.create(
-            user=user,
-            action=ActivityLog.ACTION_CREATED
-        )
-        
-        assert log.get_action_display_class() == 'created'
-        
-        log.action = ActivityLog.ACTION_UPDATED
-        assert log.get_action_display_class() == 'updated'
-        
-        log.action = ActivityLog.ACTION_DELETED
-        assert log.get_action_display_class() == 'deleted'
-    
-    def test_get_icon(self):
-        """Test get_icon returns correct icon name."""
-        user = UserFactory()
-        log = ActivityLog.objects.create(
-            user=user,
-            action=ActivityLog.ACTION_CREATED
-        )
-        
-        assert log.get_icon() == 'plus-circle'
-        
-        log.action = ActivityLog.ACTION_UPDATED
-        assert log.get_icon() == 'edit'
-        
-        log.action = ActivityLog.ACTION_LOGIN
-        assert log.get_icon() == 'log-in'
-    
-    def test_get_age_in_days(self):
+    def test_get_age_in_days(self, class_user):
         """Test get_age_in_days calculates correctly."""
-        user = UserFactory()
+        user = class_user
         past_time = timezone.now() - timedelta(days=5)
         
         log = ActivityLog.objects.create(
@@ -539,9 +718,9 @@ class TestActivityLogModel:
         age = log.get_age_in_days()
         assert 4 <= age <= 6
     
-    def test_get_age_in_hours(self):
+    def test_get_age_in_hours(self, class_user):
         """Test get_age_in_hours calculates correctly."""
-        user = UserFactory()
+        user = class_user
         past_time = timezone.now() - timedelta(hours=12)
         
         log = ActivityLog.objects.create(
@@ -554,71 +733,75 @@ class TestActivityLogModel:
         age = log.get_age_in_hours()
         assert 11 <= age <= 13
     
-    def test_is_recent(self):
+    def test_is_recent(self, class_user):
         """Test is_recent method."""
-        user = UserFactory()
+        user = class_user
+        now = timezone.now()
         
         # Recent log (1 hour ago)
         recent_log = ActivityLog.objects.create(
             user=user,
             action=ActivityLog.ACTION_CREATED,
-            timestamp=timezone.now() - timedelta(hours=1)
+            timestamp=now - timedelta(hours=1)
         )
         
         # Old log (25 hours ago)
         old_log = ActivityLog.objects.create(
             user=user,
             action=ActivityLog.ACTION_CREATED,
-            timestamp=timezone.now() - timedelta(hours=25)
+            timestamp=now - timedelta(hours=25)
         )
         
         assert recent_log.is_recent(hours=24) is True
         assert old_log.is_recent(hours=24) is False
     
-    def test_get_recent_activities(self):
+    def test_get_recent_activities(self, class_user, django_assert_num_queries):
         """Test get_recent_activities class method."""
-        user = UserFactory()
+        user = class_user
+        now = timezone.now()
         
         # Create recent activities
         ActivityLog.objects.create(
             user=user,
             action=ActivityLog.ACTION_CREATED,
-            timestamp=timezone.now() - timedelta(hours=1)
+            timestamp=now - timedelta(hours=1)
         )
         ActivityLog.objects.create(
             user=user,
             action=ActivityLog.ACTION_UPDATED,
-            timestamp=timezone.now() - timedelta(hours=2)
+            timestamp=now - timedelta(hours=2)
         )
         
         # Create old activity (should not be included)
         ActivityLog.objects.create(
             user=user,
             action=ActivityLog.ACTION_DELETED,
-            timestamp=timezone.now() - timedelta(hours=25)
+            timestamp=now - timedelta(hours=25)
         )
         
-        recent = ActivityLog.get_recent_activities(user=user, hours=24)
-        assert recent.count() == 2
+        with django_assert_num_queries(1):
+            recent = list(ActivityLog.get_recent_activities(user=user, hours=24))
+        assert len(recent) == 2
     
-    def test_get_recent_activities_with_limit(self):
+    def test_get_recent_activities_with_limit(self, class_user):
         """Test get_recent_activities respects limit parameter."""
-        user = UserFactory()
+        user = class_user
+        now = timezone.now()
+        
+        timestamps = [now - timedelta(hours=i) for i in range(10)]
         
         # Create more than limit
-        for i in range(10):
-            ActivityLog.objects.create(
-                user=user,
-                action=ActivityLog.ACTION_CREATED,
-                timestamp=timezone.now() - timedelta(hours=i)
-            )
+        ActivityLog.objects.bulk_create([
+            ActivityLog(user=user, action=ActivityLog.ACTION_CREATED, timestamp=timestamp)
+            for timestamp in timestamps
+        ])
         
-        recent = ActivityLog.get_recent_activities(user=user, hours=24, limit=5)
-        assert recent.count() == 5
+        recent = list(ActivityLog.get_recent_activities(user=user, hours=24, limit=5))
+        assert len(recent) == 5
     
-    def test_get_activities_for_object(self):
+    def test_get_activities_for_object(self, class_user, task_content_type, django_assert_num_queries):
         """Test get_activities_for_object class method."""
-        user = UserFactory()
+        user = class_user
         task = TaskFactory()
         
         # Create activities for the task
@@ -629,28 +812,35 @@ class TestActivityLogModel:
         other_task = TaskFactory()
         ActivityLog.log_activity(user=user, action=ActivityLog.ACTION_CREATED, obj=other_task)
         
-        activities = ActivityLog.get_activities_for_object(task)
-        assert activities.count() == 2
-        assert all(act.content_object == task for act in activities)
+        with django_assert_num_queries(1):
+            activities = list(ActivityLog.get_activities_for_object(task))
+        # The post_save signal also logs the task's creation
+        assert len(activities) == 3
+        # Compare the raw generic key columns instead of resolving content_object per row
+        assert all(
+            act.content_type_id == task_content_type.id and act.object_id == task.pk
+            for act in activities
+        )
     
-    def test_activity_log_ordering(self):
+    def test_activity_log_ordering(self, class_user):
         """Test that activity logs are ordered by timestamp descending."""
-        user = UserFactory()
+        user = class_user
+        now = timezone.now()
         
         log1 = ActivityLog.objects.create(
             user=user,
             action=ActivityLog.ACTION_CREATED,
-            timestamp=timezone.now() - timedelta(hours=2)
+            timestamp=now - timedelta(hours=2)
         )
         log2 = ActivityLog.objects.create(
             user=user,
             action=ActivityLog.ACTION_UPDATED,
-            timestamp=timezone.now() - timedelta(hours=1)
+            timestamp=now - timedelta(hours=1)
         )
         log3 = ActivityLog.objects.create(
             user=user,
             action=ActivityLog.ACTION_DELETED,
-            timestamp=timezone.now()
+            timestamp=now
         )
         
         logs = list(ActivityLog.objects.all())
@@ -658,9 +848,9 @@ class TestActivityLogModel:
         assert logs[1] == log2
         assert logs[2] == log1
     
-    def test_activity_log_all_action_choices(self):
+    def test_activity_log_all_action_choices(self, class_user):
         """Test that all action choices are valid."""
-        user = UserFactory()
+        user = class_user
         
         # Test all action constants
         actions = [
@@ -680,394 +870,293 @@ class TestActivityLogModel:
             ActivityLog.ACTION_LOGOUT,
         ]
         
-        for action in actions:
-            log = ActivityLog.objects.create(
-                user=user,
-                action=action
-            )
+        logs = ActivityLog.objects.bulk_create(
+            [ActivityLog(user=user, action=action) for action in actions]
+        )
+        
+        for log, action in zip(logs, actions):
             assert log.action == action
             assert log.get_action_display()  # Should not raise error
 
 
-# ============================================================================
-# Permission Classes Tests
-# ============================================================================
-
-@pytest.mark.django_db
-@pytest.mark.permission
-class TestIsTeamMemberPermission:
-    """Test suite for IsTeamMember permission class."""
+@pytest.mark.model
+class TestActivityLogDisplay:
+    """
+    ActivityLog display helpers that only read in-memory attributes.
     
-    def test_has_permission_authenticated_user(self, authenticated_api_client, user):
-        """Test has_permission returns True for authenticated user."""
-        from core.permissions import IsTeamMember
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/teams/')
-        request.user = user
-        
-        permission = IsTeamMember()
-        assert permission.has_permission(request, APIView()) is True
+    These run without the django_db marker on unsaved instances, so any
+    accidental query fails the test instead of costing a transaction.
+    """
     
-    def test_has_permission_unauthenticated_user(self):
-        """Test has_permission returns False for unauthenticated user."""
-        from core.permissions import IsTeamMember
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/teams/')
-        request.user = None
+    def test_activity_log_str_representation(self):
+        """Test string representation of ActivityLog."""
+        user = User(username='testuser')
+        log = ActivityLog(
+            user=user,
+            action=ActivityLog.ACTION_CREATED
+        )
         
-        permission = IsTeamMember()
-        assert permission.has_permission(request, APIView()) is False
+        str_repr = str(log)
+        assert 'testuser' in str_repr
+        assert 'Created' in str_repr
     
-    def test_has_object_permission_team_member(self, team_with_members):
-        """Test has_object_permission returns True for team member."""
-        from core.permissions import IsTeamMember
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
+    def test_get_user_display_with_user(self):
+        """Test get_user_display when user exists."""
+        user = User(username='testuser')
+        log = ActivityLog(
+            user=user,
+            action=ActivityLog.ACTION_CREATED
+        )
         
-        team, owner, admin, member = team_with_members
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/teams/{team.id}/')
-        request.user = member
+        assert log.get_user_display() == 'testuser'
+    
+    def test_get_user_display_without_user(self):
+        """Test get_user_display when user is None."""
+        log = ActivityLog(
+            action=ActivityLog.ACTION_CREATED
+        )
         
-        permission = IsTeamMember()
-        assert permission.has_object_permission(request, APIView(), team) is True
+        assert log.get_user_display() == 'System'
     
-    def test_has_object_permission_not_team_member(self, team, user):
-        """Test has_object_permission returns False for non-team member."""
-        from core.permissions import IsTeamMember
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
+    def test_get_action_display_class(self):
+        """Test get_action_display_class returns correct CSS class."""
+        user = User(username='testuser')
+        log = ActivityLog(
+            user=user,
+            action=ActivityLog.ACTION_CREATED
+        )
         
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/teams/{team.id}/')
-        request.user = user
+        assert log.get_action_display_class() == 'created'
+        
+        log.action = ActivityLog.ACTION_UPDATED
+        assert log.get_action_display_class() == 'updated'
         
-        permission = IsTeamMember()
-        assert permission.has_object_permission(request, APIView(), team) is False
+        log.action = ActivityLog.ACTION_DELETED
+        assert log.get_action_display_class() == 'deleted'
     
-    def test_has_object_permission_wrong_object_type(self, user):
-        """Test has_object_permission raises PermissionDenied for wrong object type."""
-        from core.permissions import IsTeamMember
-        from rest_framework.exceptions import PermissionDenied
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
+    def test_get_icon(self):
+        """Test get_icon returns correct icon name."""
+        user = User(username='testuser')
+        log = ActivityLog(
+            user=user,
+            action=ActivityLog.ACTION_CREATED
+        )
         
-        factory = APIRequestFactory()
-        request = factory.get('/api/teams/1/')
-        request.user = user
+        assert log.get_icon() == 'plus-circle'
         
-        permission = IsTeamMember()
-        with pytest.raises(PermissionDenied):
-            permission.has_object_permission(request, APIView(), "not a team")
+        log.action = ActivityLog.ACTION_UPDATED
+        assert log.get_icon() == 'edit'
+        
+        log.action = ActivityLog.ACTION_LOGIN
+        assert log.get_icon() == 'log-in'
+
+
+# ============================================================================
+# Permission Classes Tests
+# ============================================================================
+
+@pytest.fixture(scope='module')
+def api_factory():
+    """DRF request factory used to build requests for permission checks."""
+    return _FACTORY
+
+
+@pytest.fixture(scope='module')
+def drf_view():
+    """Bare APIView instance passed to permission checks."""
+    return _VIEW
+
+
+@pytest.fixture(scope='class')
+def prebuilt_request(api_factory):
+    """
+    Single request shared by every test in a class.
+    
+    Permission classes only look at ``request.user``, so tests set that
+    attribute in place instead of building a new request each time.
+    """
+    return api_factory.get('/api/')
 
 
-@pytest.mark.django_db
 @pytest.mark.permission
-class TestIsProjectMemberPermission:
-    """Test suite for IsProjectMember permission class."""
-    
-    def test_has_permission_authenticated_user(self, authenticated_api_client, user):
-        """Test has_permission returns True for authenticated user."""
-        from core.permissions import IsProjectMember
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/projects/')
+class TestHasPermission:
+    """
+    View-level has_permission checks for all permission classes.
+    
+    These only inspect ``request.user.is_authenticated``, so they run without
+    the django_db marker against a stub user.
+    """
+    
+    @pytest.mark.parametrize('perm_cls', list(_PERMISSIONS))
+    @pytest.mark.parametrize('user,expected', [
+        (SimpleNamespace(is_authenticated=True), True),
+        (None, False),
+    ], ids=['authenticated', 'unauthenticated'])
+    def test_has_permission(self, perm_cls, user, expected, prebuilt_request):
+        """Test has_permission allows authenticated users and rejects anonymous ones."""
+        request = prebuilt_request
         request.user = user
         
-        permission = IsProjectMember()
-        assert permission.has_permission(request, APIView()) is True
+        permission = _PERMISSIONS[perm_cls]
+        assert permission.has_permission(request, _VIEW) is expected
+
+
+_ROLES = ['owner', 'admin', 'member']
+
+
+def _member_with_role(shared_members, role):
+    """Pick the ``role`` user out of a ``(container, owner, admin, member)`` fixture tuple."""
+    return shared_members[1 + _ROLES.index(role)]
+
+
+def _check_object_permission(permission, user, obj, request, assert_num_queries, queries):
+    """Run ``permission.has_object_permission`` for ``user`` under a query-count assertion."""
+    request.user = user
+    with assert_num_queries(queries):
+        return permission.has_object_permission(request, _VIEW, obj)
+
+
+# Membership checks are a single EXISTS query; assignee/creator checks
+# compare already-loaded foreign keys and must not query at all.
+# Module/class-scoped fixtures are requested through usefixtures so they are
+# built outside the per-test transaction instead of inside it (and rolled back).
+
+@pytest.mark.django_db(transaction=False)
+@pytest.mark.permission
+@pytest.mark.usefixtures('class_savepoint', 'shared_team_with_members', 'class_user')
+class TestIsTeamMemberPermission:
+    """Test suite for IsTeamMember permission class."""
     
-    def test_has_permission_unauthenticated_user(self):
-        """Test has_permission returns False for unauthenticated user."""
-        from core.permissions import IsProjectMember
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/projects/')
-        request.user = None
+    @pytest.mark.parametrize('role', _ROLES)
+    def test_team_member(self, role, shared_team_with_members, prebuilt_request, django_assert_num_queries):
+        """Test every team role is allowed."""
+        team = shared_team_with_members[0]
+        user = _member_with_role(shared_team_with_members, role)
         
-        permission = IsProjectMember()
-        assert permission.has_permission(request, APIView()) is False
+        allowed = _check_object_permission(
+            _IS_TEAM_MEMBER, user, team, prebuilt_request, django_assert_num_queries, 1
+        )
+        assert allowed is True
     
-    def test_has_object_permission_project_member(self, project_with_members):
-        """Test has_object_permission returns True for project member."""
-        from core.permissions import IsProjectMember
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        project, owner, admin, member = project_with_members
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/projects/{project.id}/')
-        request.user = member
-        
-        permission = IsProjectMember()
-        assert permission.has_object_permission(request, APIView(), project) is True
+    def test_not_team_member(self, class_user, team, prebuilt_request, django_assert_num_queries):
+        """Test a user outside the team is denied."""
+        allowed = _check_object_permission(
+            _IS_TEAM_MEMBER, class_user, team, prebuilt_request, django_assert_num_queries, 1
+        )
+        assert allowed is False
+
+
+@pytest.mark.django_db(transaction=False)
+@pytest.mark.permission
+@pytest.mark.usefixtures('class_savepoint', 'shared_project_with_members', 'class_user')
+class TestIsProjectMemberPermission:
+    """Test suite for IsProjectMember permission class."""
     
-    def test_has_object_permission_not_project_member(self, project, user):
-        """Test has_object_permission returns False for non-project member."""
-        from core.permissions import IsProjectMember
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
+    @pytest.mark.parametrize('role', _ROLES)
+    def test_project_member(self, role, shared_project_with_members, prebuilt_request, django_assert_num_queries):
+        """Test every project role is allowed."""
+        project = shared_project_with_members[0]
+        user = _member_with_role(shared_project_with_members, role)
         
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/projects/{project.id}/')
-        request.user = user
-        
-        permission = IsProjectMember()
-        assert permission.has_object_permission(request, APIView(), project) is False
+        allowed = _check_object_permission(
+            _IS_PROJECT_MEMBER, user, project, prebuilt_request, django_assert_num_queries, 1
+        )
+        assert allowed is True
     
-    def test_has_object_permission_wrong_object_type(self, user):
-        """Test has_object_permission raises PermissionDenied for wrong object type."""
-        from core.permissions import IsProjectMember
-        from rest_framework.exceptions import PermissionDenied
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/projects/1/')
-        request.user = user
-        
-        permission = IsProjectMember()
-        with pytest.raises(PermissionDenied):
-            permission.has_object_permission(request, APIView(), "not a project")
+    def test_not_project_member(self, class_user, project, prebuilt_request, django_assert_num_queries):
+        """Test a user outside the project is denied."""
+        allowed = _check_object_permission(
+            _IS_PROJECT_MEMBER, class_user, project, prebuilt_request, django_assert_num_queries, 1
+        )
+        assert allowed is False
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.permission
+@pytest.mark.usefixtures('class_savepoint', 'shared_project_with_members')
 class TestIsTaskAssigneePermission:
     """Test suite for IsTaskAssignee permission class."""
     
-    def test_has_permission_authenticated_user(self, authenticated_api_client, user):
-        """Test has_permission returns True for authenticated user."""
-        from core.permissions import IsTaskAssignee
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/tasks/')
-        request.user = user
-        
-        permission = IsTaskAssignee()
-        assert permission.has_permission(request, APIView()) is True
+    def test_task_assignee(self, user, task, prebuilt_request, django_assert_num_queries):
+        """Test the assignee is allowed without a membership query."""
+        allowed = _check_object_permission(
+            _IS_TASK_ASSIGNEE, user, task, prebuilt_request, django_assert_num_queries, 0
+        )
+        assert allowed is True
     
-    def test_has_permission_unauthenticated_user(self):
-        """Test has_permission returns False for unauthenticated user."""
-        from core.permissions import IsTaskAssignee
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/tasks/')
-        request.user = None
+    def test_task_creator(self, user, project, prebuilt_request, django_assert_num_queries):
+        """Test the creator is allowed without a membership query."""
+        task = TaskFactory(project=project, created_by=user, assignee=None)
         
-        permission = IsTaskAssignee()
-        assert permission.has_permission(request, APIView()) is False
+        allowed = _check_object_permission(
+            _IS_TASK_ASSIGNEE, user, task, prebuilt_request, django_assert_num_queries, 0
+        )
+        assert allowed is True
     
-    def test_has_object_permission_task_assignee(self, task, user):
-        """Test has_object_permission returns True for task assignee."""
-        from core.permissions import IsTaskAssignee
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        task.assignee = user
-        task.save()
-        
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/tasks/{task.id}/')
-        request.user = user
+    @pytest.mark.parametrize('role', _ROLES)
+    def test_project_member(self, role, shared_project_with_members, prebuilt_request, django_assert_num_queries):
+        """Test project members who neither created nor own the task are allowed."""
+        project = shared_project_with_members[0]
+        user = _member_with_role(shared_project_with_members, role)
+        task = TaskFactory(project=project, assignee=None, created_by=None)
         
-        permission = IsTaskAssignee()
-        assert permission.has_object_permission(request, APIView(), task) is True
+        allowed = _check_object_permission(
+            _IS_TASK_ASSIGNEE, user, task, prebuilt_request, django_assert_num_queries, 1
+        )
+        assert allowed is True
     
-    def test_has_object_permission_task_creator(self, task, user):
-        """Test has_object_permission returns True for task creator."""
-        from core.permissions import IsTaskAssignee
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        task.created_by = user
-        task.assignee = None  # Not assigned
-        task.save()
-        
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/tasks/{task.id}/')
-        request.user = user
+    def test_no_access(self, user, project, prebuilt_request, django_assert_num_queries):
+        """Test a user with no relation to the task is denied."""
+        task = TaskFactory(project=project, assignee=None, created_by=None)
         
-        permission = IsTaskAssignee()
-        assert permission.has_object_permission(request, APIView(), task) is True
-    
-    def test_has_object_permission_project_member(self, project_with_members, task):
-        """Test has_object_permission returns True for project member."""
-        from core.permissions import IsTaskAssignee
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        project, owner, admin, member = project_with_members
-        task.project = project
-        task.assignee = None
-        task.created_by = None
-        task.save()
-        
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/tasks/{task.id}/')
-        request.user = member
-        
-        permission = IsTaskAssignee()
-        assert permission.has_object_permission(request, APIView(), task) is True
-    
-    def test_has_object_permission_no_access(self, task, user):
-        """Test has_object_permission returns False when user has no access."""
-        from core.permissions import IsTaskAssignee
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        # Create another user who is not assignee, creator, or project member
-        other_user = UserFactory()
-        task.assignee = None
-        task.created_by = None
-        task.save()
-        
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/tasks/{task.id}/')
-        request.user = other_user
-        
-        permission = IsTaskAssignee()
-        assert permission.has_object_permission(request, APIView(), task) is False
-    
-    def test_has_object_permission_wrong_object_type(self, user):
-        """Test has_object_permission raises PermissionDenied for wrong object type."""
-        from core.permissions import IsTaskAssignee
-        from rest_framework.exceptions import PermissionDenied
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/tasks/1/')
-        request.user = user
-        
-        permission = IsTaskAssignee()
-        with pytest.raises(PermissionDenied):
-            permission.has_object_permission(request, APIView(), "not a task")
+        allowed = _check_object_permission(
+            _IS_TASK_ASSIGNEE, user, task, prebuilt_request, django_assert_num_queries, 1
+        )
+        assert allowed is False
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 @pytest.mark.permission
+@pytest.mark.usefixtures('class_savepoint', 'shared_project_with_members')
 class TestIsTaskAssigneeOnlyPermission:
     """Test suite for IsTaskAssigneeOnly permission class."""
     
-    def test_has_permission_authenticated_user(self, authenticated_api_client, user):
-        """Test has_permission returns True for authenticated user."""
-        from core.permissions import IsTaskAssigneeOnly
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/tasks/')
-        request.user = user
-        
-        permission = IsTaskAssigneeOnly()
-        assert permission.has_permission(request, APIView()) is True
-    
-    def test_has_permission_unauthenticated_user(self):
-        """Test has_permission returns False for unauthenticated user."""
-        from core.permissions import IsTaskAssigneeOnly
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/tasks/')
-        request.user = None
-        
-        permission = IsTaskAssigneeOnly()
-        assert permission.has_permission(request, APIView()) is False
-    
-    def test_has_object_permission_task_assignee(self, task, user):
-        """Test has_object_permission returns True for task assignee."""
-        from core.permissions import IsTaskAssigneeOnly
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        task.assignee = user
-        task.save()
-        
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/tasks/{task.id}/')
-        request.user = user
-        
-        permission = IsTaskAssigneeOnly()
-        assert permission.has_object_permission(request, APIView(), task) is True
-    
-    def test_has_object_permission_task_creator_not_assigned(self, task, user):
-        """Test has_object_permission returns False for task creator who is not assigned."""
-        from core.permissions import IsTaskAssigneeOnly
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        task.created_by = user
-        task.assignee = None  # Not assigned
-        task.save()
-        
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/tasks/{task.id}/')
-        request.user = user
-        
-        permission = IsTaskAssigneeOnly()
-        assert permission.has_object_permission(request, APIView(), task) is False
-    
-    def test_has_object_permission_project_member_not_assigned(self, project_with_members, task):
-        """Test has_object_permission returns False for project member who is not assigned."""
-        from core.permissions import IsTaskAssigneeOnly
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        project, owner, admin, member = project_with_members
-        task.project = project
-        task.assignee = None
-        task.save()
-        
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/tasks/{task.id}/')
-        request.user = member
-        
-        permission = IsTaskAssigneeOnly()
-        assert permission.has_object_permission(request, APIView(), task) is False
-    
-    def test_has_object_permission_no_assignee(self, task, user):
-        """Test has_object_permission returns False when task has no assignee."""
-        from core.permissions import IsTaskAssigneeOnly
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        task.assignee = None
-        task.save()
-        
-        factory = APIRequestFactory()
-        request = factory.get(f'/api/tasks/{task.id}/')
-        request.user = user
-        
-        permission = IsTaskAssigneeOnly()
-        assert permission.has_object_permission(request, APIView(), task) is False
-    
-    def test_has_object_permission_wrong_object_type(self, user):
-        """Test has_object_permission raises PermissionDenied for wrong object type."""
-        from core.permissions import IsTaskAssigneeOnly
-        from rest_framework.exceptions import PermissionDenied
-        from rest_framework.test import APIRequestFactory
-        from rest_framework.views import APIView
-        
-        factory = APIRequestFactory()
-        request = factory.get('/api/tasks/1/')
-        request.user = user
-        
-        permission = IsTaskAssigneeOnly()
-        with pytest.raises(PermissionDenied):
-            permission.has_object_permission(request, APIView(), "not a task")
+    def test_task_assignee(self, user, task, prebuilt_request, django_assert_num_queries):
+        """Test the assignee is allowed."""
+        allowed = _check_object_permission(
+            _IS_TASK_ASSIGNEE_ONLY, user, task, prebuilt_request, django_assert_num_queries, 0
+        )
+        assert allowed is True
+    
+    @pytest.mark.parametrize('relation', ['creator', 'project_member', 'unrelated'])
+    def test_not_assigned(self, relation, user, project, shared_project_with_members,
+                          prebuilt_request, django_assert_num_queries):
+        """Test nobody but the assignee is allowed, including creators and project members."""
+        if relation == 'creator':
+            task = TaskFactory(project=project, created_by=user, assignee=None)
+        elif relation == 'project_member':
+            project, owner, admin, user = shared_project_with_members
+            task = TaskFactory(project=project, assignee=None, created_by=None)
+        else:
+            task = TaskFactory(project=project, assignee=None, created_by=None)
+        
+        allowed = _check_object_permission(
+            _IS_TASK_ASSIGNEE_ONLY, user, task, prebuilt_request, django_assert_num_queries, 0
+        )
+        assert allowed is False
+
+
+@pytest.mark.permission
+@pytest.mark.parametrize('perm_cls,bad_obj,url', [
+    (IsTeamMember, 'not a team', '/api/teams/1/'),
+    (IsProjectMember, 'not a project', '/api/projects/1/'),
+    (IsTaskAssignee, 'not a task', '/api/tasks/1/'),
+    (IsTaskAssigneeOnly, 'not a task', '/api/tasks/1/'),
+])
+def test_has_object_permission_wrong_object_type(perm_cls, bad_obj, url, api_factory, drf_view):
+    """Test has_object_permission raises PermissionDenied for wrong object type."""
+    request = api_factory.get(url)
+    request.user = SimpleNamespace(is_authenticated=True)
+    
+    with pytest.raises(PermissionDenied):
+        _PERMISSIONS[perm_cls].has_object_permission(request, drf_view, bad_obj)
@@ -5,22 +5,240 @@ This module contains health check endpoints for monitoring the application
 and its dependencies (database, Redis).
 """
 
+import threading
 import time
-from django.db import connection
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from django.db import InterfaceError, OperationalError, connection
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
+from core.renderers import ORJSONRenderer
 from drf_spectacular.utils import extend_schema, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
+import orjson
 import redis
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class HealthCheckView(APIView):
+def _read_settings():
+    """
+    Read the settings consulted on every probe.
+    
+    Returns:
+        tuple: (Redis URL, app version, DEBUG, /health/ cache TTL)
+    """
+    return (
+        getattr(settings, 'CELERY_BROKER_URL', None),
+        getattr(settings, 'APP_VERSION', '1.0.0'),
+        settings.DEBUG,
+        getattr(settings, 'HEALTHCHECK_CACHE_TTL', 1.0),
+    )
+
+
+# Read once at import instead of going through LazySettings on every probe;
+# refreshed by _reload_settings when a setting is overridden (tests)
+_REDIS_URL, _APP_VERSION, _DEBUG, _CACHE_TTL = _read_settings()
+_WATCHED_SETTINGS = frozenset({
+    'CELERY_BROKER_URL', 'APP_VERSION', 'DEBUG', 'HEALTHCHECK_CACHE_TTL',
+})
+
+
+@receiver(setting_changed)
+def _reload_settings(setting, **kwargs):
+    """Refresh the cached settings when override_settings changes one."""
+    global _REDIS_URL, _APP_VERSION, _DEBUG, _CACHE_TTL
+    if setting in _WATCHED_SETTINGS:
+        _REDIS_URL, _APP_VERSION, _DEBUG, _CACHE_TTL = _read_settings()
+
+# Shared pool for probes that run off the request thread. The database check
+# stays on the request thread so it reuses that thread's persistent connection.
+# Threads rather than asyncio: DRF's APIView dispatch is synchronous and the
+# app is served by gunicorn over WSGI, so an ``async def get`` would never run
+# on an event loop here.
+_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='health-probe')
+_PROBE_TIMEOUT = 5
+
+# Last /health/ result, reused for HEALTHCHECK_CACHE_TTL seconds so probe
+# bursts cost one real check instead of one per request. The body is stored
+# already serialized so cache hits skip DRF rendering entirely. 'inflight'
+# holds the Event of the request currently refreshing it, so concurrent
+# misses wait for that result instead of probing again (single flight).
+_HEALTH_CACHE = {'ts': 0.0, 'body': None, 'status': None, 'inflight': None}
+_HEALTH_CACHE_LOCK = threading.Lock()
+
+# Static part of the /health/db/ payload; DATABASES does not change at runtime
+_DB_CONFIG = settings.DATABASES['default']
+_DB_META = {
+    'engine': _DB_CONFIG.get('ENGINE', '').rsplit('.', 1)[-1],
+    'name': _DB_CONFIG.get('NAME', ''),
+    'host': _DB_CONFIG.get('HOST', ''),
+    'port': _DB_CONFIG.get('PORT', ''),
+}
+
+# Constant liveness body, built once at import
+_LIVE_PAYLOAD = {'status': 'ok'}
+
+# Last known probe outcome per service (None = not probed yet). Failures are
+# logged with a traceback only when a service goes unhealthy, and then at
+# most once per _REPEAT_LOG_INTERVAL while it stays down, so an outage under
+# per-second probing doesn't flood the log handlers.
+_PROBE_STATE = {'overall': None, 'database': None, 'redis': None}
+_PROBE_LOGGED_AT = {'overall': 0.0, 'database': 0.0, 'redis': 0.0}
+_PROBE_STATE_LOCK = threading.Lock()
+_REPEAT_LOG_INTERVAL = 60
+
+
+def _elapsed_ms(start_ns):
+    """
+    Milliseconds elapsed since a ``time.monotonic_ns()`` reading.
+    
+    Monotonic, so latencies are unaffected by wall-clock (NTP) adjustments.
+    """
+    return (time.monotonic_ns() - start_ns) / 1_000_000
+
+
+def _utc_iso_now():
+    """
+    Return the current UTC time as an ISO 8601 string.
+    
+    Formats the ``struct_time`` fields directly instead of going through
+    ``time.strftime``, which parses its format string on every call.
+    Microseconds come from the same ``time.time_ns()`` reading as the
+    seconds.
+    
+    Returns:
+        str: Timestamp like ``2024-01-15T10:30:45.123456Z``
+    """
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    g = time.gmtime(secs)
+    return (
+        f'{g.tm_year:04d}-{g.tm_mon:02d}-{g.tm_mday:02d}'
+        f'T{g.tm_hour:02d}:{g.tm_min:02d}:{g.tm_sec:02d}.{ns // 1000:06d}Z'
+    )
+
+
+def _unhealthy(err_prefix, err, elapsed_ms):
+    """
+    Build the status dict reported for a failed service probe.
+    
+    Args:
+        err_prefix: Text prepended to the error message, or '' for none
+        err: Exception (or message) describing the failure
+        elapsed_ms: Probe duration in milliseconds, or None if unknown
+        
+    Returns:
+        dict: ``{'status': 'unhealthy', 'error': ..., 'response_time_ms': ...}``
+    """
+    return {
+        'status': 'unhealthy',
+        'error': f'{err_prefix}{err}' if err_prefix else str(err),
+        'response_time_ms': elapsed_ms,
+    }
+
+
+def _log_probe_failure(service, message, extra, level=logging.ERROR, exc_info=True):
+    """
+    Log a failed probe at ``level`` on a state transition, else at DEBUG.
+    
+    Steady-state failures are still logged at ``level`` once every
+    ``_REPEAT_LOG_INTERVAL`` seconds so a long outage stays visible.
+    
+    Args:
+        service: Key into ``_PROBE_STATE``
+        message: Log message
+        extra: Structured logging context
+        level: Level used for transitions and periodic reminders
+        exc_info: Whether to attach the active exception's traceback
+    """
+    now = time.monotonic()
+    with _PROBE_STATE_LOCK:
+        due = (
+            _PROBE_STATE[service] is not False
+            or now - _PROBE_LOGGED_AT[service] >= _REPEAT_LOG_INTERVAL
+        )
+        _PROBE_STATE[service] = False
+        if due:
+            _PROBE_LOGGED_AT[service] = now
+    if due:
+        logger.log(level, message, exc_info=exc_info, extra=extra)
+    else:
+        logger.debug(message, extra=extra)
+
+
+def _log_probe_success(service, message):
+    """
+    Record a healthy probe, logging ``message`` if the service was down.
+    
+    Args:
+        service: Key into ``_PROBE_STATE``
+        message: Recovery message logged at INFO
+    """
+    with _PROBE_STATE_LOCK:
+        recovered = _PROBE_STATE[service] is False
+        _PROBE_STATE[service] = True
+    if recovered:
+        logger.info(message)
+
+
+@lru_cache(maxsize=None)
+def _get_redis_client(redis_url):
+    """
+    Return a pooled Redis client for the given URL.
+    
+    The client (and its connection pool) is built once per URL, so repeated
+    probes reuse an open socket instead of parsing the URL and doing a fresh
+    TCP handshake each time. ``health_check_interval`` lets redis-py verify
+    idle connections itself before handing them out.
+    
+    Both the connect and the read are bounded, so a Redis that accepts the
+    connection but stalls (e.g. while forking for an RDB save) fails the
+    probe within about a second instead of holding it open.
+    """
+    return redis.Redis(connection_pool=redis.ConnectionPool.from_url(
+        redis_url,
+        socket_connect_timeout=1.0,
+        socket_timeout=1.0,
+        retry_on_timeout=False,
+        max_connections=4,
+        health_check_interval=30,
+    ))
+
+
+class ProbeView(APIView):
+    """
+    Base class for the health and liveness endpoints.
+    
+    Probes are public and polled far more often than any user-facing
+    endpoint, so the DRF authentication, permission and throttling steps in
+    ``initial()`` are skipped outright rather than run against AllowAny.
+    This also means a stale or malformed Authorization header can never
+    turn a probe into a 401.
+    """
+    
+    authentication_classes = []
+    permission_classes = [AllowAny]  # Health checks should be publicly accessible
+    throttle_classes = []
+    renderer_classes = [ORJSONRenderer]
+    
+    def perform_authentication(self, request):
+        """Skip authentication; probes never need request.user."""
+    
+    def check_permissions(self, request):
+        """Skip permission checks; probes are always allowed."""
+    
+    def check_throttles(self, request):
+        """Skip throttling; probe frequency is controlled by the caller."""
+
+
+class HealthCheckView(ProbeView):
     """
     Comprehensive health check endpoint.
     
@@ -31,9 +249,9 @@ class HealthCheckView(APIView):
     
     Returns 200 if all critical services are healthy, 503 otherwise.
     This endpoint is used by Docker health checks, load balancers, and monitoring systems.
+    The result is reused for HEALTHCHECK_CACHE_TTL seconds; cached responses
+    carry ``cached: true``.
     """
-    
-    permission_classes = [AllowAny]  # Health checks should be publicly accessible
 
     @extend_schema(
         tags=['Health'],
@@ -56,6 +274,9 @@ class HealthCheckView(APIView):
         - Monitoring system checks
         - CI/CD pipeline health verification
         
+        **Caching:** The result is reused for `HEALTHCHECK_CACHE_TTL` seconds
+        (default 1s) to absorb probe bursts; cached responses include `"cached": true`.
+        
         **Note:** This endpoint does not require authentication.
         """,
         responses={
@@ -115,16 +336,62 @@ class HealthCheckView(APIView):
         Returns:
             Response: JSON response with health status of all services
         """
-        start_time = time.time()
-    health_status = {
-        'status': 'healthy',
-            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S.000000Z', time.gmtime()),
-            'version': getattr(settings, 'APP_VERSION', '1.0.0'),
-        'services': {}
-    }
+        with _HEALTH_CACHE_LOCK:
+            body = _HEALTH_CACHE['body']
+            cached_status = _HEALTH_CACHE['status']
+            fresh = body is not None and time.monotonic() - _HEALTH_CACHE['ts'] < _CACHE_TTL
+            inflight = _HEALTH_CACHE['inflight']
+            if not fresh and inflight is None:
+                _HEALTH_CACHE['inflight'] = threading.Event()
+        if fresh:
+            return HttpResponse(body, content_type='application/json', status=cached_status)
+        
+        if inflight is not None:
+            # Another request is already probing; reuse its result. If it
+            # does not finish in time, fall back to probing ourselves.
+            if inflight.wait(timeout=_PROBE_TIMEOUT):
+                with _HEALTH_CACHE_LOCK:
+                    body = _HEALTH_CACHE['body']
+                    cached_status = _HEALTH_CACHE['status']
+                if body is not None:
+                    return HttpResponse(body, content_type='application/json', status=cached_status)
+            health_status, status_code = self._run_checks()
+            return Response(health_status, status=status_code)
+        
+        try:
+            health_status, status_code = self._run_checks()
+            body = orjson.dumps({**health_status, 'cached': True})
+            with _HEALTH_CACHE_LOCK:
+                _HEALTH_CACHE.update(ts=time.monotonic(), body=body, status=status_code)
+        finally:
+            with _HEALTH_CACHE_LOCK:
+                event = _HEALTH_CACHE['inflight']
+                _HEALTH_CACHE['inflight'] = None
+            event.set()
+        
+        return Response(health_status, status=status_code)
     
+    def _run_checks(self):
+        """
+        Probe all services and build the aggregate health payload.
+        
+        Returns:
+            tuple: (health status dict, HTTP status code)
+        """
+        start_ns = time.monotonic_ns()
+        health_status = {
+            'status': 'healthy',
+            'timestamp': _utc_iso_now(),
+            'version': _APP_VERSION,
+            'services': {}
+        }
+        
         overall_healthy = True
         
+        # Probe Redis in the background while the database is checked here,
+        # so latency is max(db, redis) rather than the sum
+        redis_future = _PROBE_EXECUTOR.submit(self._check_redis)
+        
         # Check database
         db_status = self._check_database()
         health_status['services']['database'] = db_status
@@ -132,62 +399,91 @@ class HealthCheckView(APIView):
             overall_healthy = False
         
         # Check Redis
-        redis_status = self._check_redis()
+        try:
+            redis_status = redis_future.result(timeout=_PROBE_TIMEOUT)
+        except FutureTimeoutError:
+            redis_status = _unhealthy('Timeout: ', f'no response within {_PROBE_TIMEOUT}s', None)
         health_status['services']['redis'] = redis_status
         # Redis is optional in development, but required in production
-        if redis_status['status'] != 'healthy' and not settings.DEBUG:
+        if redis_status['status'] != 'healthy' and not _DEBUG:
             overall_healthy = False
         
         health_status['status'] = 'healthy' if overall_healthy else 'unhealthy'
-        health_status['response_time_ms'] = round((time.time() - start_time) * 1000, 2)
+        health_status['response_time_ms'] = round(_elapsed_ms(start_ns), 2)
         
         status_code = status.HTTP_200_OK if overall_healthy else status.HTTP_503_SERVICE_UNAVAILABLE
         
         # Log health check result
-        if not overall_healthy:
-            logger.warning(
+        if overall_healthy:
+            _log_probe_success('overall', 'Health check recovered')
+        else:
+            _log_probe_failure(
+                'overall',
                 'Health check failed',
                 extra={
                     'health_status': health_status,
                     'status_code': status_code,
-                }
+                },
+                level=logging.WARNING,
+                exc_info=False,
             )
         
-        return Response(health_status, status=status_code)
+        return health_status, status_code
     
     def _check_database(self):
         """
         Check database connectivity and response time.
         
+        Reuses the request thread's persistent connection (CONN_MAX_AGE). On
+        MySQL the probe is mysqlclient's C-level ping, a single round-trip
+        with no cursor bookkeeping; other backends fall back to ``SELECT 1``.
+        The raw ping runs under ``wrap_database_errors`` so driver errors
+        surface as Django's and mark the connection for recycling.
+        
         Returns:
             dict: Database health status with response time
         """
-        start_time = time.time()
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-                cursor.fetchone()
+        start_ns = time.monotonic_ns()
+        try:
+            connection.ensure_connection()
+            if connection.vendor == 'mysql':
+                with connection.wrap_database_errors:
+                    connection.connection.ping()
+            else:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
             
-            response_time = round((time.time() - start_time) * 1000, 2)
+            response_time = round(_elapsed_ms(start_ns), 2)
+            _log_probe_success('database', 'Database health check recovered')
             return {
                 'status': 'healthy',
                 'response_time_ms': response_time,
             }
-    except Exception as e:
-            response_time = round((time.time() - start_time) * 1000, 2)
-            logger.error(
+        except (OperationalError, InterfaceError) as e:
+            response_time = round(_elapsed_ms(start_ns), 2)
+            _log_probe_failure(
+                'database',
                 'Database health check failed',
-                exc_info=True,
+                extra={
+                    'error': str(e),
+                    'response_time_ms': response_time,
+                },
+                level=logging.WARNING,
+                exc_info=False,
+            )
+            return _unhealthy('', e, response_time)
+        except Exception as e:
+            response_time = round(_elapsed_ms(start_ns), 2)
+            _log_probe_failure(
+                'database',
+                'Database health check failed: Unexpected error',
                 extra={
                     'error': str(e),
                     'response_time_ms': response_time,
                 }
             )
-            return {
-                'status': 'unhealthy',
-                'error': str(e),
-                'response_time_ms': response_time,
-            }
+            return _unhealthy('', e, response_time)
     
     def _check_redis(self):
         """
@@ -196,9 +492,9 @@ class HealthCheckView(APIView):
         Returns:
             dict: Redis health status with response time
         """
-        start_time = time.time()
-    try:
-        redis_url = getattr(settings, 'CELERY_BROKER_URL', None)
+        start_ns = time.monotonic_ns()
+        try:
+            redis_url = _REDIS_URL
             if not redis_url:
                 return {
                     'status': 'not_configured',
@@ -206,62 +502,68 @@ class HealthCheckView(APIView):
                     'response_time_ms': None,
                 }
             
-            redis_client = redis.from_url(redis_url, socket_connect_timeout=2)
+            redis_client = _get_redis_client(redis_url)
             redis_client.ping()
-            response_time = round((time.time() - start_time) * 1000, 2)
+            response_time = round(_elapsed_ms(start_ns), 2)
+            _log_probe_success('redis', 'Redis health check recovered')
             
             return {
                 'status': 'healthy',
                 'response_time_ms': response_time,
             }
         except redis.ConnectionError as e:
-            response_time = round((time.time() - start_time) * 1000, 2)
-            logger.error(
+            response_time = round(_elapsed_ms(start_ns), 2)
+            _log_probe_failure(
+                'redis',
                 'Redis health check failed: Connection error',
-                exc_info=True,
                 extra={
                     'error': str(e),
                     'response_time_ms': response_time,
-                }
+                },
+                level=logging.WARNING,
+                exc_info=False,
             )
-            return {
-                'status': 'unhealthy',
-                'error': f'Connection error: {str(e)}',
-                'response_time_ms': response_time,
-            }
+            return _unhealthy('Connection error: ', e, response_time)
         except redis.TimeoutError as e:
-            response_time = round((time.time() - start_time) * 1000, 2)
-            logger.error(
+            response_time = round(_elapsed_ms(start_ns), 2)
+            _log_probe_failure(
+                'redis',
                 'Redis health check failed: Timeout',
-                exc_info=True,
                 extra={
                     'error': str(e),
                     'response_time_ms': response_time,
-                }
+                },
+                level=logging.WARNING,
+                exc_info=False,
             )
-            return {
-                'status': 'unhealthy',
-                'error': f'Timeout: {str(e)}',
-                'response_time_ms': response_time,
-            }
+            return _unhealthy('Timeout: ', e, response_time)
+        except redis.RedisError as e:
+            response_time = round(_elapsed_ms(start_ns), 2)
+            _log_probe_failure(
+                'redis',
+                'Redis health check failed: Redis error',
+                extra={
+                    'error': str(e),
+                    'response_time_ms': response_time,
+                },
+                level=logging.WARNING,
+                exc_info=False,
+            )
+            return _unhealthy('', e, response_time)
         except Exception as e:
-            response_time = round((time.time() - start_time) * 1000, 2)
-            logger.error(
+            response_time = round(_elapsed_ms(start_ns), 2)
+            _log_probe_failure(
+                'redis',
                 'Redis health check failed: Unexpected error',
-                exc_info=True,
                 extra={
                     'error': str(e),
                     'response_time_ms': response_time,
                 }
             )
-            return {
-                'status': 'unhealthy',
-                'error': str(e),
-                'response_time_ms': response_time,
-            }
+            return _unhealthy('', e, response_time)
 
 
-class DatabaseHealthCheckView(APIView):
+class DatabaseHealthCheckView(ProbeView):
     """
     Database-specific health check endpoint.
     
@@ -273,8 +575,6 @@ class DatabaseHealthCheckView(APIView):
     Useful for monitoring database performance and availability.
     """
     
-    permission_classes = [AllowAny]
-    
     @extend_schema(
         tags=['Health'],
         summary='Database health check',
@@ -347,53 +647,68 @@ class DatabaseHealthCheckView(APIView):
         Returns:
             Response: JSON response with database health status
         """
-        start_time = time.time()
-        db_config = settings.DATABASES['default']
+        start_ns = time.monotonic_ns()
         
         health_status = {
             'status': 'healthy',
-            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S.000000Z', time.gmtime()),
-            'database': {
-                'engine': db_config.get('ENGINE', '').split('.')[-1],
-                'name': db_config.get('NAME', ''),
-                'host': db_config.get('HOST', ''),
-                'port': db_config.get('PORT', ''),
-            }
+            'timestamp': _utc_iso_now(),
+            # Copy so per-request fields never leak into the shared template
+            'database': dict(_DB_META),
         }
         
         # Perform database check
-        db_check_start = time.time()
+        db_check_start_ns = time.monotonic_ns()
         try:
             with connection.cursor() as cursor:
-                # Test basic query
-                cursor.execute("SELECT 1")
-                cursor.fetchone()
-                
-                # Test database name
-                cursor.execute("SELECT DATABASE()")
-                db_name = cursor.fetchone()[0]
-                
-                # Test connection info
-                cursor.execute("SELECT CONNECTION_ID()")
-                connection_id = cursor.fetchone()[0]
+                if connection.vendor == 'mysql':
+                    # Basic query, database name and connection id in one round-trip
+                    cursor.execute("SELECT 1, DATABASE(), CONNECTION_ID()")
+                    _, db_name, connection_id = cursor.fetchone()
+                else:
+                    # DATABASE()/CONNECTION_ID() are MySQL-only
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+                    db_name = connection.settings_dict['NAME']
+                    connection_id = None
             
-            response_time = round((time.time() - db_check_start) * 1000, 2)
+            response_time = round(_elapsed_ms(db_check_start_ns), 2)
             health_status['database']['response_time_ms'] = response_time
             health_status['database']['connection_id'] = connection_id
             health_status['database']['actual_database'] = db_name
+            _log_probe_success('database', 'Database health check recovered')
             
             status_code = status.HTTP_200_OK
             
-    except Exception as e:
-            response_time = round((time.time() - db_check_start) * 1000, 2)
+        except (OperationalError, InterfaceError) as e:
+            response_time = round(_elapsed_ms(db_check_start_ns), 2)
             health_status['status'] = 'unhealthy'
             health_status['database']['error'] = str(e)
             health_status['database']['response_time_ms'] = response_time
-            health_status['response_time_ms'] = round((time.time() - start_time) * 1000, 2)
+            health_status['response_time_ms'] = round(_elapsed_ms(start_ns), 2)
             
-            logger.error(
+            _log_probe_failure(
+                'database',
                 'Database health check failed',
-                exc_info=True,
+                extra={
+                    'database_config': health_status['database'],
+                    'error': str(e),
+                },
+                level=logging.WARNING,
+                exc_info=False,
+            )
+            
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            
+        except Exception as e:
+            response_time = round(_elapsed_ms(db_check_start_ns), 2)
+            health_status['status'] = 'unhealthy'
+            health_status['database']['error'] = str(e)
+            health_status['database']['response_time_ms'] = response_time
+            health_status['response_time_ms'] = round(_elapsed_ms(start_ns), 2)
+            
+            _log_probe_failure(
+                'database',
+                'Database health check failed: Unexpected error',
                 extra={
                     'database_config': health_status['database'],
                     'error': str(e),
@@ -402,11 +717,11 @@ class DatabaseHealthCheckView(APIView):
             
             status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         
-        health_status['response_time_ms'] = round((time.time() - start_time) * 1000, 2)
+        health_status['response_time_ms'] = round(_elapsed_ms(start_ns), 2)
         return Response(health_status, status=status_code)
 
 
-class RedisHealthCheckView(APIView):
+class RedisHealthCheckView(ProbeView):
     """
     Redis-specific health check endpoint.
     
@@ -419,8 +734,6 @@ class RedisHealthCheckView(APIView):
     Useful for monitoring Redis performance and availability.
     """
     
-    permission_classes = [AllowAny]
-    
     @extend_schema(
         tags=['Health'],
         summary='Redis health check',
@@ -493,12 +806,12 @@ class RedisHealthCheckView(APIView):
         Returns:
             Response: JSON response with Redis health status
         """
-        start_time = time.time()
-        redis_url = getattr(settings, 'CELERY_BROKER_URL', None)
+        start_ns = time.monotonic_ns()
+        redis_url = _REDIS_URL
         
         health_status = {
             'status': 'healthy',
-            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S.000000Z', time.gmtime()),
+            'timestamp': _utc_iso_now(),
             'redis': {
                 'url': redis_url or 'not_configured',
             }
@@ -507,100 +820,143 @@ class RedisHealthCheckView(APIView):
         if not redis_url:
             health_status['status'] = 'not_configured'
             health_status['redis']['error'] = 'Redis URL not configured'
-            health_status['response_time_ms'] = round((time.time() - start_time) * 1000, 2)
+            health_status['response_time_ms'] = round(_elapsed_ms(start_ns), 2)
             return Response(health_status, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         
         # Perform Redis check
-        redis_check_start = time.time()
+        redis_check_start_ns = time.monotonic_ns()
+        failure = None
         try:
-            redis_client = redis.from_url(redis_url, socket_connect_timeout=2)
+            redis_client = _get_redis_client(redis_url)
             
-            # Ping test
-            ping_result = redis_client.ping()
+            # Ping test and basic server info in a single round-trip. Reply
+            # errors come back as values so a failed INFO doesn't fail the ping.
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.ping()
+            pipe.info('server')
+            ping_result, info = pipe.execute(raise_on_error=False)
+            if isinstance(ping_result, Exception):
+                raise ping_result
             if not ping_result:
-                raise Exception('Ping failed')
+                raise redis.RedisError('Ping failed')
             
-            # Get basic server info
-            try:
-                info = redis_client.info('server')
+            # If info command fails, continue without server info
+            if not isinstance(info, Exception):
                 health_status['redis']['server_info'] = {
                     'redis_version': info.get('redis_version', 'unknown'),
                     'connected_clients': info.get('connected_clients', 0),
                 }
-            except Exception:
-                # If info command fails, continue without server info
-                pass
             
-            response_time = round((time.time() - redis_check_start) * 1000, 2)
-            health_status['redis']['response_time_ms'] = response_time
-            status_code = status.HTTP_200_OK
+            health_status['redis']['response_time_ms'] = round(_elapsed_ms(redis_check_start_ns), 2)
+            _log_probe_success('redis', 'Redis health check recovered')
             
         except redis.ConnectionError as e:
-            response_time = round((time.time() - redis_check_start) * 1000, 2)
-            health_status['status'] = 'unhealthy'
-            health_status['redis']['error'] = f'Connection error: {str(e)}'
-            health_status['redis']['response_time_ms'] = response_time
-            health_status['response_time_ms'] = round((time.time() - start_time) * 1000, 2)
-            
-            logger.error(
+            failure = _unhealthy('Connection error: ', e, round(_elapsed_ms(redis_check_start_ns), 2))
+            _log_probe_failure(
+                'redis',
                 'Redis health check failed: Connection error',
-                exc_info=True,
                 extra={
                     'redis_url': redis_url,
                     'error': str(e),
-                }
+                },
+                level=logging.WARNING,
+                exc_info=False,
             )
             
-            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
-            
         except redis.TimeoutError as e:
-            response_time = round((time.time() - redis_check_start) * 1000, 2)
-            health_status['status'] = 'unhealthy'
-            health_status['redis']['error'] = f'Timeout: {str(e)}'
-            health_status['redis']['response_time_ms'] = response_time
-            health_status['response_time_ms'] = round((time.time() - start_time) * 1000, 2)
-            
-            logger.error(
+            failure = _unhealthy('Timeout: ', e, round(_elapsed_ms(redis_check_start_ns), 2))
+            _log_probe_failure(
+                'redis',
                 'Redis health check failed: Timeout',
-                exc_info=True,
                 extra={
                     'redis_url': redis_url,
                     'error': str(e),
-                }
+                },
+                level=logging.WARNING,
+                exc_info=False,
             )
             
-            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        except redis.RedisError as e:
+            failure = _unhealthy('', e, round(_elapsed_ms(redis_check_start_ns), 2))
+            _log_probe_failure(
+                'redis',
+                'Redis health check failed: Redis error',
+                extra={
+                    'redis_url': redis_url,
+                    'error': str(e),
+                },
+                level=logging.WARNING,
+                exc_info=False,
+            )
             
         except Exception as e:
-            response_time = round((time.time() - redis_check_start) * 1000, 2)
-            health_status['status'] = 'unhealthy'
-            health_status['redis']['error'] = str(e)
-            health_status['redis']['response_time_ms'] = response_time
-            health_status['response_time_ms'] = round((time.time() - start_time) * 1000, 2)
-            
-            logger.error(
+            failure = _unhealthy('', e, round(_elapsed_ms(redis_check_start_ns), 2))
+            _log_probe_failure(
+                'redis',
                 'Redis health check failed: Unexpected error',
-                exc_info=True,
                 extra={
                     'redis_url': redis_url,
                     'error': str(e),
                 }
             )
-            
+        
+        if failure is None:
+            status_code = status.HTTP_200_OK
+        else:
+            health_status['status'] = failure.pop('status')
+            health_status['redis'].update(failure)
             status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         
-        health_status['response_time_ms'] = round((time.time() - start_time) * 1000, 2)
+        health_status['response_time_ms'] = round(_elapsed_ms(start_ns), 2)
         return Response(health_status, status=status_code)
 
 
-# Backward compatibility: Keep the function-based view for simple use cases
-def health_check(request):
+class LivenessView(ProbeView):
     """
-    Simple function-based health check endpoint (backward compatibility).
+    Liveness probe endpoint.
     
-    This is a simple wrapper around HealthCheckView for backward compatibility.
-    For new code, use HealthCheckView instead.
+    Answers "is this process up and serving requests?" and nothing else: it
+    never touches the database or Redis, so it stays cheap under frequent
+    probing and does not flap when a dependency is down. Use it for Docker
+    HEALTHCHECK and Kubernetes livenessProbe; keep /health/ for readiness
+    checks where dependency status matters.
     """
-    view = HealthCheckView()
-    view.request = request
-    return view.get(request)
+    
+    @extend_schema(
+        tags=['Health'],
+        summary='Liveness probe',
+        description="""
+        Report that the application process is alive.
+        
+        This endpoint performs no dependency checks (no database or Redis
+        access) and always returns the same body.
+        
+        **Response Codes:**
+        - `200 OK`: The process is serving requests
+        
+        **Use Cases:**
+        - Docker HEALTHCHECK
+        - Kubernetes livenessProbe
+        
+        **Note:** This endpoint does not require authentication.
+        """,
+        responses={
+            200: {
+                'description': 'Process is alive',
+                'examples': [
+                    OpenApiExample(
+                        'Alive',
+                        value={'status': 'ok'},
+                    ),
+                ],
+            },
+        },
+    )
+    def get(self, request):
+        """
+        Return the constant liveness payload.
+        
+        Returns:
+            Response: ``{"status": "ok"}``
+        """
+        return Response(_LIVE_PAYLOAD)
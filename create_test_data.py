@@ -14,6 +14,7 @@ Usage:
 
 import os
 import django
+from collections import Counter
 from datetime import timedelta
 from django.utils import timezone
 
@@ -21,13 +22,47 @@ from django.utils import timezone
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'taskmanager.settings')
 django.setup()
 
-from django.db.models import Count
-from users.models import User
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from users.models import User, UserProfile
 from teams.models import Team, TeamMember
 from projects.models import Project, ProjectMember
 from tasks.models import Task
 
 
+def bulk_get_or_create(queryset, match_field, rows, build):
+    """
+    Get or create rows by natural key with one SELECT and one bulk INSERT.
+    
+    Instead of an exists()/get()/create() round-trip per row, all rows are
+    looked up at once, only the missing ones are built and inserted with
+    bulk_create, and the result is read back so every instance has a PK.
+    Note that bulk_create does not send pre_save/post_save signals.
+    
+    Args:
+        queryset: Queryset or manager scoping the lookup (e.g. one project's tasks)
+        match_field: Field identifying a row within the queryset
+        rows: List of dicts, each containing a ``match_field`` key
+        build: Callable returning an unsaved model instance for a row
+        
+    Returns:
+        tuple: (dict mapping match_field value to instance, set of created keys)
+    """
+    lookup = {f'{match_field}__in': [row[match_field] for row in rows]}
+    existing = {getattr(obj, match_field): obj for obj in queryset.filter(**lookup)}
+    to_create = [build(row) for row in rows if row[match_field] not in existing]
+    if not to_create:
+        return existing, set()
+    
+    # ignore_conflicts lets the database skip rows another run inserted since
+    # the SELECT (users, teams, projects and memberships have unique keys);
+    # the read-back below returns them either way
+    queryset.model.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
+    created = {row[match_field] for row in rows} - existing.keys()
+    # Read back: MySQL's bulk_create doesn't set primary keys on the instances
+    return {getattr(obj, match_field): obj for obj in queryset.filter(**lookup)}, created
+
+
 def create_test_data():
     """Create comprehensive test data for testing."""
     
@@ -35,140 +70,158 @@ def create_test_data():
     print("Creating Test Data for Data Processing Tasks")
     print("=" * 70)
     
-    # Create users
-    print("\n1. Creating users...")
-    users = []
-    for i in range(1, 4):
-        username = f'testuser{i}'
-        email = f'test{i}@example.com'
+    # Everything is inserted in one transaction, so a seed run costs a
+    # single commit and a failure part-way leaves nothing behind
+    with transaction.atomic():
+        # Create users
+        print("\n1. Creating users...")
+        password = make_password('testpass123')
+        user_rows = [
+            {'username': f'testuser{i}', 'email': f'test{i}@example.com', 'last_name': f'User {i}'}
+            for i in range(1, 4)
+        ]
+        users_by_name, created = bulk_get_or_create(
+            User.objects, 'username', user_rows,
+            lambda row: User(password=password, first_name='Test', role='developer', **row),
+        )
+        users = [users_by_name[row['username']] for row in user_rows]
+        for user in users:
+            if user.username in created:
+                print(f"   ✅ Created user: {user.username}")
+            else:
+                print(f"   User '{user.username}' already exists, skipping...")
         
-        # Check if user exists
-        if User.objects.filter(username=username).exists():
-            user = User.objects.get(username=username)
-            print(f"   User '{username}' already exists, skipping...")
-        else:
-            user = User.objects.create_user(
-                username=username,
-                email=email,
-                password='testpass123',
-                first_name='Test',
-                last_name=f'User {i}',
-                role='developer'
+        # bulk_create skips post_save, so add the profiles the signal would create
+        if created:
+            UserProfile.objects.bulk_create(
+                [UserProfile(user=users_by_name[username]) for username in created],
+                ignore_conflicts=True,
             )
-            print(f"   ✅ Created user: {username}")
         
-        users.append(user)
-    
-    # Create team
-    print("\n2. Creating team...")
-    team_name = 'Development Team'
-    
-    if Team.objects.filter(name=team_name).exists():
-        team = Team.objects.get(name=team_name)
-        print(f"   Team '{team_name}' already exists, using existing...")
-    else:
-        team = Team.objects.create(
-            name=team_name,
-            description='A test development team for testing analytics and reports'
+        # Create team
+        print("\n2. Creating team...")
+        team_name = 'Development Team'
+        
+        teams, created = bulk_get_or_create(
+            Team.objects, 'name', [{'name': team_name}],
+            lambda row: Team(
+                description='A test development team for testing analytics and reports',
+                **row
+            ),
         )
-        print(f"   ✅ Created team: {team_name}")
-    
-    # Add team members
-    print("\n3. Adding team members...")
-    roles = [TeamMember.ROLE_OWNER, TeamMember.ROLE_ADMIN, TeamMember.ROLE_MEMBER]
-    for user, role in zip(users, roles):
-        if not TeamMember.objects.filter(team=team, user=user).exists():
-            TeamMember.objects.create(team=team, user=user, role=role)
-            print(f"   ✅ Added {user.username} as {role}")
+        team = teams[team_name]
+        if created:
+            print(f"   ✅ Created team: {team_name}")
         else:
-            print(f"   {user.username} already a member")
-    
-    # Create project
-    print("\n4. Creating project...")
-    project_name = 'Test Project'
-    
-    if Project.objects.filter(team=team, name=project_name).exists():
-        project = Project.objects.get(team=team, name=project_name)
-        print(f"   Project '{project_name}' already exists, using existing...")
-    else:
-        project = Project.objects.create(
-            name=project_name,
-            description='A test project for analytics and reporting',
-            team=team,
-            status=Project.STATUS_ACTIVE,
-            priority=Project.PRIORITY_HIGH,
-            deadline=timezone.now() + timedelta(days=30)
+            print(f"   Team '{team_name}' already exists, using existing...")
+        
+        # Add team members
+        print("\n3. Adding team members...")
+        roles = [TeamMember.ROLE_OWNER, TeamMember.ROLE_ADMIN, TeamMember.ROLE_MEMBER]
+        _, created = bulk_get_or_create(
+            TeamMember.objects.filter(team=team), 'user_id',
+            [{'user_id': user.id, 'role': role} for user, role in zip(users, roles)],
+            lambda row: TeamMember(team=team, **row),
         )
-        print(f"   ✅ Created project: {project_name}")
-    
-    # Add project members
-    print("\n5. Adding project members...")
-    roles = [ProjectMember.ROLE_OWNER, ProjectMember.ROLE_ADMIN, ProjectMember.ROLE_MEMBER]
-    for user, role in zip(users, roles):
-        if not ProjectMember.objects.filter(project=project, user=user).exists():
-            ProjectMember.objects.create(project=project, user=user, role=role)
-            print(f"   ✅ Added {user.username} as {role}")
+        for user, role in zip(users, roles):
+            if user.id in created:
+                print(f"   ✅ Added {user.username} as {role}")
+            else:
+                print(f"   {user.username} already a member")
+        
+        # Create project
+        print("\n4. Creating project...")
+        project_name = 'Test Project'
+        
+        projects, created = bulk_get_or_create(
+            Project.objects.filter(team=team), 'name', [{'name': project_name}],
+            lambda row: Project(
+                description='A test project for analytics and reporting',
+                team=team,
+                status=Project.STATUS_ACTIVE,
+                priority=Project.PRIORITY_HIGH,
+                deadline=timezone.now() + timedelta(days=30),
+                **row
+            ),
+        )
+        project = projects[project_name]
+        if created:
+            print(f"   ✅ Created project: {project_name}")
         else:
-            print(f"   {user.username} already a project member")
-    
-    # Create tasks
-    print("\n6. Creating tasks...")
-    tasks_data = [
-        {
-            'title': 'Complete User Authentication',
-            'status': Task.STATUS_DONE,
-            'priority': Task.PRIORITY_HIGH,
-            'assignee': users[0],
-            'due_date': timezone.now() - timedelta(days=2)  # Past due (completed)
-        },
-        {
-            'title': 'Implement API Endpoints',
-            'status': Task.STATUS_IN_PROGRESS,
-            'priority': Task.PRIORITY_HIGH,
-            'assignee': users[1],
-            'due_date': timezone.now() + timedelta(days=5)
-        },
-        {
-            'title': 'Write Unit Tests',
-            'status': Task.STATUS_TODO,
-            'priority': Task.PRIORITY_MEDIUM,
-            'assignee': users[2],
-            'due_date': timezone.now() + timedelta(days=10)
-        },
-        {
-            'title': 'Setup CI/CD Pipeline',
-            'status': Task.STATUS_DONE,
-            'priority': Task.PRIORITY_MEDIUM,
-            'assignee': users[0],
-            'due_date': timezone.now() - timedelta(days=1)  # Past due (completed)
-        },
-        {
-            'title': 'Fix Database Migration Issue',
-            'status': Task.STATUS_BLOCKED,
-            'priority': Task.PRIORITY_HIGH,
-            'assignee': users[1],
-            'due_date': timezone.now() + timedelta(days=3)
-        },
-        {
-            'title': 'Update Documentation',
-            'status': Task.STATUS_TODO,
-            'priority': Task.PRIORITY_LOW,
-            'assignee': None,  # Unassigned
-            'due_date': timezone.now() + timedelta(days=15)
-        },
-        {
-            'title': 'Code Review',
-            'status': Task.STATUS_IN_PROGRESS,
-            'priority': Task.PRIORITY_MEDIUM,
-            'assignee': users[2],
-            'due_date': timezone.now() + timedelta(days=7)
-        },
-    ]
-    
-    created_count = 0
-    for task_data in tasks_data:
-        if not Task.objects.filter(project=project, title=task_data['title']).exists():
-            Task.objects.create(
+            print(f"   Project '{project_name}' already exists, using existing...")
+        
+        # Add project members
+        print("\n5. Adding project members...")
+        roles = [ProjectMember.ROLE_OWNER, ProjectMember.ROLE_ADMIN, ProjectMember.ROLE_MEMBER]
+        _, created = bulk_get_or_create(
+            ProjectMember.objects.filter(project=project), 'user_id',
+            [{'user_id': user.id, 'role': role} for user, role in zip(users, roles)],
+            lambda row: ProjectMember(project=project, **row),
+        )
+        for user, role in zip(users, roles):
+            if user.id in created:
+                print(f"   ✅ Added {user.username} as {role}")
+            else:
+                print(f"   {user.username} already a project member")
+        
+        # Create tasks
+        print("\n6. Creating tasks...")
+        tasks_data = [
+            {
+                'title': 'Complete User Authentication',
+                'status': Task.STATUS_DONE,
+                'priority': Task.PRIORITY_HIGH,
+                'assignee': users[0],
+                'due_date': timezone.now() - timedelta(days=2)  # Past due (completed)
+            },
+            {
+                'title': 'Implement API Endpoints',
+                'status': Task.STATUS_IN_PROGRESS,
+                'priority': Task.PRIORITY_HIGH,
+                'assignee': users[1],
+                'due_date': timezone.now() + timedelta(days=5)
+            },
+            {
+                'title': 'Write Unit Tests',
+                'status': Task.STATUS_TODO,
+                'priority': Task.PRIORITY_MEDIUM,
+                'assignee': users[2],
+                'due_date': timezone.now() + timedelta(days=10)
+            },
+            {
+                'title': 'Setup CI/CD Pipeline',
+                'status': Task.STATUS_DONE,
+                'priority': Task.PRIORITY_MEDIUM,
+                'assignee': users[0],
+                'due_date': timezone.now() - timedelta(days=1)  # Past due (completed)
+            },
+            {
+                'title': 'Fix Database Migration Issue',
+                'status': Task.STATUS_BLOCKED,
+                'priority': Task.PRIORITY_HIGH,
+                'assignee': users[1],
+                'due_date': timezone.now() + timedelta(days=3)
+            },
+            {
+                'title': 'Update Documentation',
+                'status': Task.STATUS_TODO,
+                'priority': Task.PRIORITY_LOW,
+                'assignee': None,  # Unassigned
+                'due_date': timezone.now() + timedelta(days=15)
+            },
+            {
+                'title': 'Code Review',
+                'status': Task.STATUS_IN_PROGRESS,
+                'priority': Task.PRIORITY_MEDIUM,
+                'assignee': users[2],
+                'due_date': timezone.now() + timedelta(days=7)
+            },
+        ]
+        
+        # bulk_create skips post_save, so seeding doesn't queue notifications
+        _, created = bulk_get_or_create(
+            Task.objects.filter(project=project), 'title', tasks_data,
+            lambda task_data: Task(
                 title=task_data['title'],
                 description=f"Description for {task_data['title']}",
                 project=project,
@@ -177,27 +230,33 @@ def create_test_data():
                 assignee=task_data.get('assignee'),
                 created_by=users[0],
                 due_date=task_data.get('due_date')
-            )
-            created_count += 1
-            print(f"   ✅ Created task: {task_data['title']}")
-        else:
-            print(f"   Task '{task_data['title']}' already exists")
+            ),
+        )
+        for task_data in tasks_data:
+            if task_data['title'] in created:
+                print(f"   ✅ Created task: {task_data['title']}")
+            else:
+                print(f"   Task '{task_data['title']}' already exists")
     
     # Summary
+    # One query for the project's tasks; total, per-status counts and IDs
+    # are all derived from it
+    project_tasks = list(Task.objects.filter(project=project).values_list('id', 'status'))
+    task_ids = [task_id for task_id, _ in project_tasks]
+    status_counts = Counter(task_status for _, task_status in project_tasks)
+    
     print("\n" + "=" * 70)
     print("Test Data Summary")
     print("=" * 70)
     print(f"✅ Users: {User.objects.count()}")
     print(f"✅ Teams: {Team.objects.count()}")
     print(f"✅ Projects: {Project.objects.count()}")
-    print(f"✅ Tasks: {Task.objects.filter(project=project).count()}")
+    print(f"✅ Tasks: {len(project_tasks)}")
     print(f"\n📊 Project Statistics:")
     print(f"   Project: {project.name} (ID: {project.id})")
     print(f"   Team: {team.name} (ID: {team.id})")
     print(f"   Tasks by Status:")
-    for status, count in Task.objects.filter(project=project).values('status').annotate(
-        count=Count('id')
-    ).values_list('status', 'count'):
+    for status, count in status_counts.items():
         print(f"      - {status}: {count}")
     
     print("\n" + "=" * 70)
@@ -206,7 +265,7 @@ def create_test_data():
     print(f"\nYou can now test the tasks with:")
     print(f"  - Project ID: {project.id}")
     print(f"  - Team ID: {team.id}")
-    print(f"  - Task IDs: {list(Task.objects.filter(project=project).values_list('id', flat=True))}")
+    print(f"  - Task IDs: {task_ids}")
     print("\nRun: docker-compose exec web python test_data_processing_tasks.py")
 
 
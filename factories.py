@@ -23,8 +23,10 @@ Documentation:
 """
 
 import factory
+from functools import lru_cache
 from factory import fuzzy
 from factory.django import DjangoModelFactory
+from django.contrib.auth.hashers import get_hasher, make_password
 from django.utils import timezone
 from datetime import timedelta
 from faker import Faker
@@ -36,9 +38,99 @@ from tasks.models import Task, TaskComment, TaskDependency
 from notifications.models import Notification
 
 fake = Faker()
+fake.seed_instance(0)
+
+# Free text is drawn from corpora generated once at import instead of asking
+# Faker for fresh text per object, which is slow on large batches. The fixed
+# seed keeps generated data identical from run to run.
+_TEXTS = {
+    max_chars: [fake.text(max_nb_chars=max_chars) for _ in range(64)]
+    for max_chars in (200, 300, 500)
+}
+_TITLES = [fake.sentence(nb_words=4) for _ in range(1024)]
+_MESSAGES = [fake.sentence(nb_words=10) for _ in range(256)]
+
+# Provider methods bound once here; factory.Faker('first_name') resolves the
+# provider again on every build.
+_first_name = fake.first_name
+_last_name = fake.last_name
+_phone_number = fake.phone_number
+_job = fake.job
+_company = fake.company
+_address = fake.address
+_city = fake.city
+_country = fake.country
+_url = fake.url
+
+
+def _from_corpus(corpus):
+    """
+    Declaration that cycles through a pre-generated corpus.
+    
+    Uses the factory's sequence counter, so consecutive instances never
+    repeat a value until the corpus wraps around.
+    """
+    return factory.Sequence(lambda n: corpus[n % len(corpus)])
+
+
+@lru_cache(maxsize=None)
+def _hashed_password(raw_password, algorithm):
+    """
+    Hash a password once and reuse it for every factory-built user.
+    
+    Hashing is deliberately slow (PBKDF2 runs hundreds of thousands of
+    iterations), and test users almost always share the same password, so
+    each distinct password is hashed only once per hasher. ``algorithm`` is
+    part of the key so a hasher override (e.g. in tests) gets its own hash.
+    
+    Args:
+        raw_password: Plain-text password
+        algorithm: Algorithm name of the default hasher
+        
+    Returns:
+        str: Encoded password hash
+    """
+    return make_password(raw_password)
 
 
-class UserFactory(DjangoModelFactory):
+class BulkCreateMixin:
+    """
+    Adds ``bulk_create_batch()`` to a DjangoModelFactory.
+    
+    ``create_batch(n)`` issues one INSERT per instance plus one per
+    SubFactory. ``bulk_create_batch(n)`` builds the instances in memory,
+    creates each SubFactory dependency that was not passed in exactly once
+    and shares it across the batch, then inserts everything with
+    ``bulk_create``.
+    
+    Note that bulk_create does not send ``post_save`` signals, and on MySQL
+    the returned instances have no primary keys.
+    
+    Example:
+        tasks = TaskFactory.bulk_create_batch(1000, project=project)
+    """
+    
+    @classmethod
+    def bulk_create_batch(cls, size, batch_size=1000, **kwargs):
+        """
+        Build ``size`` instances and insert them with one bulk_create.
+        
+        Args:
+            size: Number of instances to create
+            batch_size: Rows per INSERT statement
+            **kwargs: Field values shared by every instance
+            
+        Returns:
+            list: The created model instances
+        """
+        for name, declaration in cls._meta.declarations.items():
+            if isinstance(declaration, factory.SubFactory) and name not in kwargs:
+                kwargs[name] = declaration.get_factory()()
+        objs = cls.build_batch(size, **kwargs)
+        return cls._meta.model.objects.bulk_create(objs, batch_size=batch_size)
+
+
+class UserFactory(BulkCreateMixin, DjangoModelFactory):
     """
     Factory for creating User instances.
     
@@ -52,24 +144,41 @@ class UserFactory(DjangoModelFactory):
     
     username = factory.Sequence(lambda n: f'user{n}')
     email = factory.LazyAttribute(lambda obj: f'{obj.username}@example.com')
-    first_name = factory.Faker('first_name')
-    last_name = factory.Faker('last_name')
+    first_name = factory.LazyFunction(_first_name)
+    last_name = factory.LazyFunction(_last_name)
     role = fuzzy.FuzzyChoice(['admin', 'manager', 'developer', 'member'])
-    phone = factory.Faker('phone_number')
-    bio = factory.Faker('text', max_nb_chars=200)
+    phone = factory.LazyFunction(_phone_number)
+    bio = _from_corpus(_TEXTS[200])
     is_active = True
     is_staff = False
     is_superuser = False
+    password = 'testpass123'
     
-    @factory.post_generation
-    def password(self, create, extracted, **kwargs):
-        """Set password after user creation."""
-        if not create:
-            return
+    @classmethod
+    def _adjust_kwargs(cls, **kwargs):
+        """
+        Hash the password before the user is built or saved.
         
-        password = extracted if extracted else 'testpass123'
-        self.set_password(password)
-        self.save()
+        Runs for every strategy (create, build, bulk_create_batch), so the
+        row is INSERTed once with its hash instead of INSERTed and then
+        UPDATEd by a post-generation hook.
+        """
+        password = kwargs.get('password') or 'testpass123'
+        kwargs['password'] = _hashed_password(password, get_hasher().algorithm)
+        return kwargs
+
+
+class FreshUserFactory(UserFactory):
+    """
+    UserFactory variant that always INSERTs, skipping the get_or_create SELECT.
+    
+    Use it where the rows are known to be new (bulk seeding, session
+    fixtures). Usernames stay unique because the sequence counter is shared
+    with UserFactory.
+    """
+    
+    class Meta:
+        django_get_or_create = ()
 
 
 class AdminUserFactory(UserFactory):
@@ -106,13 +215,13 @@ class UserProfileFactory(DjangoModelFactory):
         django_get_or_create = ('user',)
     
     user = factory.SubFactory(UserFactory)
-    job_title = factory.Faker('job')
-    department = factory.Faker('company')
+    job_title = factory.LazyFunction(_job)
+    department = factory.LazyFunction(_company)
     location = fuzzy.FuzzyChoice(['remote', 'office', 'hybrid'])
-    address = factory.Faker('address')
-    city = factory.Faker('city')
-    country = factory.Faker('country')
-    website = factory.Faker('url')
+    address = factory.LazyFunction(_address)
+    city = factory.LazyFunction(_city)
+    country = factory.LazyFunction(_country)
+    website = factory.LazyFunction(_url)
     linkedin = factory.LazyAttribute(lambda obj: f'https://linkedin.com/in/{obj.user.username}')
     github = factory.LazyAttribute(lambda obj: f'https://github.com/{obj.user.username}')
     twitter = factory.LazyAttribute(lambda obj: f'https://twitter.com/{obj.user.username}')
@@ -134,10 +243,17 @@ class TeamFactory(DjangoModelFactory):
         django_get_or_create = ('name',)
     
     name = factory.Sequence(lambda n: f'Team {n}')
-    description = factory.Faker('text', max_nb_chars=300)
+    description = _from_corpus(_TEXTS[300])
+
+
+class FreshTeamFactory(TeamFactory):
+    """TeamFactory variant that skips the get_or_create SELECT."""
+    
+    class Meta:
+        django_get_or_create = ()
 
 
-class TeamMemberFactory(DjangoModelFactory):
+class TeamMemberFactory(BulkCreateMixin, DjangoModelFactory):
     """
     Factory for creating TeamMember instances.
     
@@ -165,7 +281,7 @@ class ProjectFactory(DjangoModelFactory):
         django_get_or_create = ('team', 'name')
     
     name = factory.Sequence(lambda n: f'Project {n}')
-    description = factory.Faker('text', max_nb_chars=500)
+    description = _from_corpus(_TEXTS[500])
     status = fuzzy.FuzzyChoice(['planning', 'active', 'on_hold', 'completed', 'cancelled'])
     priority = fuzzy.FuzzyChoice(['high', 'medium', 'low'])
     deadline = factory.LazyFunction(
@@ -174,6 +290,13 @@ class ProjectFactory(DjangoModelFactory):
     team = factory.SubFactory(TeamFactory)
 
 
+class FreshProjectFactory(ProjectFactory):
+    """ProjectFactory variant that skips the get_or_create SELECT."""
+    
+    class Meta:
+        django_get_or_create = ()
+
+
 class ActiveProjectFactory(ProjectFactory):
     """Factory for creating active projects."""
     status = 'active'
@@ -184,7 +307,7 @@ class CompletedProjectFactory(ProjectFactory):
     status = 'completed'
 
 
-class ProjectMemberFactory(DjangoModelFactory):
+class ProjectMemberFactory(BulkCreateMixin, DjangoModelFactory):
     """
     Factory for creating ProjectMember instances.
     
@@ -200,7 +323,7 @@ class ProjectMemberFactory(DjangoModelFactory):
     role = fuzzy.FuzzyChoice(['owner', 'admin', 'member'])
 
 
-class TaskFactory(DjangoModelFactory):
+class TaskFactory(BulkCreateMixin, DjangoModelFactory):
     """
     Factory for creating Task instances.
     
@@ -211,8 +334,11 @@ class TaskFactory(DjangoModelFactory):
         model = Task
         django_get_or_create = ('project', 'title')
     
-    title = factory.Faker('sentence', nb_words=4)
-    description = factory.Faker('text', max_nb_chars=500)
+    # Suffixed with the sequence number: TaskFactory gets-or-creates on
+    # (project, title), so a title repeated after the corpus wraps around
+    # would silently return an existing task.
+    title = factory.Sequence(lambda n: f'{_TITLES[n % len(_TITLES)]} #{n}')
+    description = _from_corpus(_TEXTS[500])
     status = fuzzy.FuzzyChoice(['todo', 'in_progress', 'done', 'blocked'])
     priority = fuzzy.FuzzyChoice(['high', 'medium', 'low'])
     due_date = factory.LazyFunction(
@@ -223,6 +349,13 @@ class TaskFactory(DjangoModelFactory):
     created_by = factory.SubFactory(UserFactory)
 
 
+class FreshTaskFactory(TaskFactory):
+    """TaskFactory variant that skips the get_or_create SELECT."""
+    
+    class Meta:
+        django_get_or_create = ()
+
+
 class TodoTaskFactory(TaskFactory):
     """Factory for creating tasks in todo status."""
     status = 'todo'
@@ -248,7 +381,7 @@ class HighPriorityTaskFactory(TaskFactory):
     priority = 'high'
 
 
-class TaskCommentFactory(DjangoModelFactory):
+class TaskCommentFactory(BulkCreateMixin, DjangoModelFactory):
     """
     Factory for creating TaskComment instances.
     
@@ -260,7 +393,7 @@ class TaskCommentFactory(DjangoModelFactory):
     
     task = factory.SubFactory(TaskFactory)
     author = factory.SubFactory(UserFactory)
-    content = factory.Faker('text', max_nb_chars=300)
+    content = _from_corpus(_TEXTS[300])
 
 
 class TaskDependencyFactory(DjangoModelFactory):
@@ -287,7 +420,7 @@ class TaskDependencyFactory(DjangoModelFactory):
     dependent_task = factory.SubFactory(TaskFactory)
 
 
-class NotificationFactory(DjangoModelFactory):
+class NotificationFactory(BulkCreateMixin, DjangoModelFactory):
     """
     Factory for creating Notification instances.
     
@@ -298,7 +431,7 @@ class NotificationFactory(DjangoModelFactory):
         model = Notification
     
     user = factory.SubFactory(UserFactory)
-    message = factory.Faker('sentence', nb_words=10)
+    message = _from_corpus(_MESSAGES)
     type = fuzzy.FuzzyChoice([
         'task_assigned',
         'task_completed',
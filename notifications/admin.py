@@ -6,12 +6,90 @@ for the Notification model.
 """
 
 from django.contrib import admin
-from django.utils.translation import gettext_lazy as _
+from django.db.models.functions import Substr
+from django.utils.translation import get_language, gettext_lazy as _
 from django.utils.html import format_html
-from django.urls import reverse
+from django.urls import NoReverseMatch, reverse
 from .models import Notification
 
 
+# Admin change URL per (app_label, model), with a '{pk}' placeholder. The
+# pattern only differs by primary key between rows, so it is reversed once
+# per content type instead of once per row.
+_change_url_templates = {}
+
+
+# Colour used for each notification type in the changelist
+_TYPE_COLORS = {
+    Notification.TYPE_TASK_ASSIGNED: '#2271b1',  # Blue
+    Notification.TYPE_TASK_COMPLETED: '#00a32a',  # Green
+    Notification.TYPE_TASK_UPDATED: '#2271b1',  # Blue
+    Notification.TYPE_TASK_DUE_SOON: '#dba617',  # Yellow
+    Notification.TYPE_TASK_OVERDUE: '#d63638',  # Red
+    Notification.TYPE_TASK_STATUS_CHANGED: '#2271b1',  # Blue
+    Notification.TYPE_TASK_PRIORITY_CHANGED: '#dba617',  # Yellow
+    Notification.TYPE_PROJECT_UPDATED: '#2271b1',  # Blue
+    Notification.TYPE_PROJECT_MEMBER_ADDED: '#00a32a',  # Green
+    Notification.TYPE_PROJECT_MEMBER_REMOVED: '#d63638',  # Red
+    Notification.TYPE_PROJECT_STATUS_CHANGED: '#2271b1',  # Blue
+    Notification.TYPE_TEAM_MEMBER_ADDED: '#00a32a',  # Green
+    Notification.TYPE_TEAM_MEMBER_REMOVED: '#d63638',  # Red
+    Notification.TYPE_COMMENT_ADDED: '#2271b1',  # Blue
+    Notification.TYPE_ATTACHMENT_ADDED: '#2271b1',  # Blue
+    Notification.TYPE_TASK_DEPENDENCY_ADDED: '#2271b1',  # Blue
+    Notification.TYPE_TASK_DEPENDENCY_COMPLETED: '#00a32a',  # Green
+    Notification.TYPE_WELCOME: '#00a32a',  # Green
+    Notification.TYPE_SYSTEM: '#50575e',  # Gray
+}
+
+# Rendered type and read-status badges per (language, value). There are
+# only a few distinct badges, so each is formatted once rather than per row;
+# the language is part of the key because the labels are translated.
+_badge_html = {}
+
+
+def _type_badge(notification):
+    """Return the coloured label HTML for a notification's type."""
+    key = (get_language(), 'type', notification.type)
+    if key not in _badge_html:
+        _badge_html[key] = format_html(
+            '<span style="color: {}; font-weight: bold;">{}</span>',
+            _TYPE_COLORS.get(notification.type, '#50575e'),
+            notification.get_type_display()
+        )
+    return _badge_html[key]
+
+
+def _read_badge(read):
+    """Return the coloured read/unread status HTML."""
+    key = (get_language(), 'read', read)
+    if key not in _badge_html:
+        if read:
+            _badge_html[key] = format_html(
+                '<span style="color: #00a32a; font-weight: bold;">✓ {}</span>',
+                _('Read')
+            )
+        else:
+            _badge_html[key] = format_html(
+                '<span style="color: #d63638; font-weight: bold;">● {}</span>',
+                _('Unread')
+            )
+    return _badge_html[key]
+
+
+def _get_change_url(content_type, pk):
+    """Return the admin change URL for ``pk``, or None if not registered."""
+    key = (content_type.app_label, content_type.model)
+    if key not in _change_url_templates:
+        try:
+            url = reverse(f'admin:{key[0]}_{key[1]}_change', args=['__pk__'])
+        except NoReverseMatch:
+            url = None
+        _change_url_templates[key] = url and url.replace('__pk__', '{pk}')
+    template = _change_url_templates[key]
+    return template.format(pk=pk) if template else None
+
+
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
     """
@@ -40,11 +118,12 @@ class NotificationAdmin(admin.ModelAdmin):
         'read_at',
     ]
     
+    # Username is matched by prefix (LIKE 'q%') so MySQL can answer it from
+    # its unique index. Email keeps a contains match so searches for a
+    # domain such as '@example.com' still find users.
     search_fields = [
-        'user__username',
+        '^user__username',
         'user__email',
-        'user__first_name',
-        'user__last_name',
         'message',
     ]
     
@@ -96,63 +175,37 @@ class NotificationAdmin(admin.ModelAdmin):
     
     ordering = ['-created_at']
     
+    autocomplete_fields = ['user']
+    
     list_per_page = 50
     
+    # Joined into the changelist query; `user` and the related object link
+    # are rendered on every row
+    list_select_related = ['user', 'related_content_type']
+    
     actions = ['mark_as_read', 'mark_as_unread']
     
     def get_message_preview(self, obj):
         """Display a preview of the notification message."""
-        if len(obj.message) > 60:
-            return f"{obj.message[:60]}..."
-        return obj.message
+        # One character past the cut-off is fetched to tell whether to add '...'
+        preview = getattr(obj, 'message_preview', None)
+        if preview is None:
+            preview = obj.message[:61]
+        if len(preview) > 60:
+            return f"{preview[:60]}..."
+        return preview
     get_message_preview.short_description = _('Message')
     get_message_preview.admin_order_field = 'message'
     
     def get_type_display_colored(self, obj):
         """Display notification type with color coding."""
-        type_colors = {
-            Notification.TYPE_TASK_ASSIGNED: '#2271b1',  # Blue
-            Notification.TYPE_TASK_COMPLETED: '#00a32a',  # Green
-            Notification.TYPE_TASK_UPDATED: '#2271b1',  # Blue
-            Notification.TYPE_TASK_DUE_SOON: '#dba617',  # Yellow
-            Notification.TYPE_TASK_OVERDUE: '#d63638',  # Red
-            Notification.TYPE_TASK_STATUS_CHANGED: '#2271b1',  # Blue
-            Notification.TYPE_TASK_PRIORITY_CHANGED: '#dba617',  # Yellow
-            Notification.TYPE_PROJECT_UPDATED: '#2271b1',  # Blue
-            Notification.TYPE_PROJECT_MEMBER_ADDED: '#00a32a',  # Green
-            Notification.TYPE_PROJECT_MEMBER_REMOVED: '#d63638',  # Red
-            Notification.TYPE_PROJECT_STATUS_CHANGED: '#2271b1',  # Blue
-            Notification.TYPE_TEAM_MEMBER_ADDED: '#00a32a',  # Green
-            Notification.TYPE_TEAM_MEMBER_REMOVED: '#d63638',  # Red
-            Notification.TYPE_COMMENT_ADDED: '#2271b1',  # Blue
-            Notification.TYPE_ATTACHMENT_ADDED: '#2271b1',  # Blue
-            Notification.TYPE_TASK_DEPENDENCY_ADDED: '#2271b1',  # Blue
-            Notification.TYPE_TASK_DEPENDENCY_COMPLETED: '#00a32a',  # Green
-            Notification.TYPE_WELCOME: '#00a32a',  # Green
-            Notification.TYPE_SYSTEM: '#50575e',  # Gray
-        }
-        
-        color = type_colors.get(obj.type, '#50575e')
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            obj.get_type_display()
-        )
+        return _type_badge(obj)
     get_type_display_colored.short_description = _('Type')
     get_type_display_colored.admin_order_field = 'type'
     
     def get_read_status_colored(self, obj):
         """Display read status with color coding."""
-        if obj.read:
-            return format_html(
-                '<span style="color: #00a32a; font-weight: bold;">✓ {}</span>',
-                _('Read')
-            )
-        else:
-            return format_html(
-                '<span style="color: #d63638; font-weight: bold;">● {}</span>',
-                _('Unread')
-            )
+        return _read_badge(obj.read)
     get_read_status_colored.short_description = _('Status')
     get_read_status_colored.admin_order_field = 'read'
     
@@ -163,11 +216,8 @@ class NotificationAdmin(admin.ModelAdmin):
                 # Try to get admin URL for the related object
                 content_type = obj.related_content_type
                 model = content_type.model_class()
-                if model:
-                    admin_url = reverse(
-                        f'admin:{content_type.app_label}_{content_type.model}_change',
-                        args=[obj.related_object_id]
-                    )
+                admin_url = model and _get_change_url(content_type, obj.related_object_id)
+                if admin_url:
                     return format_html(
                         '<a href="{}" target="_blank">{}</a>',
                         admin_url,
@@ -181,8 +231,7 @@ class NotificationAdmin(admin.ModelAdmin):
     
     def get_age_display(self, obj):
         """Display the age of the notification in a human-readable format."""
-        age_days = obj.get_age_in_days()
-        age_hours = obj.get_age_in_hours()
+        age_days, age_hours = obj.get_age()
         
         if age_days == 0:
             if age_hours == 0:
@@ -200,10 +249,13 @@ class NotificationAdmin(admin.ModelAdmin):
     def mark_as_read(self, request, queryset):
         """Bulk action to mark selected notifications as read."""
         from django.utils import timezone
-        updated = queryset.filter(read=False).update(
+        queryset = queryset.filter(read=False)
+        user_ids = set(queryset.values_list('user_id', flat=True))
+        updated = queryset.update(
             read=True,
             read_at=timezone.now()
         )
+        Notification.invalidate_counts(user_ids)
         self.message_user(
             request,
             _('{} notification(s) marked as read.').format(updated),
@@ -213,10 +265,13 @@ class NotificationAdmin(admin.ModelAdmin):
     
     def mark_as_unread(self, request, queryset):
         """Bulk action to mark selected notifications as unread."""
-        updated = queryset.filter(read=True).update(
+        queryset = queryset.filter(read=True)
+        user_ids = set(queryset.values_list('user_id', flat=True))
+        updated = queryset.update(
             read=False,
             read_at=None
         )
+        Notification.invalidate_counts(user_ids)
         self.message_user(
             request,
             _('{} notification(s) marked as unread.').format(updated),
@@ -240,4 +295,10 @@ class NotificationAdmin(admin.ModelAdmin):
         if not request.user.is_superuser:
             # Non-superusers can only see their own notifications
             qs = qs.filter(user=request.user)
-        return qs.select_related('user', 'related_content_type')
+        # Only the start of the message is read, and metadata (not shown in
+        # the changelist) isn't decoded; both are loaded on access, e.g. by
+        # the change form
+        qs = qs.annotate(message_preview=Substr('message', 1, 61)).defer('message', 'metadata')
+        return qs.select_related('user', 'related_content_type').prefetch_related(
+            Notification.related_object_prefetch()
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-17 07:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='read',
+            field=models.BooleanField(default=False, help_text='Whether the notification has been read'),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.CharField(choices=[('task_assigned', 'Task Assigned'), ('task_completed', 'Task Completed'), ('task_updated', 'Task Updated'), ('task_due_soon', 'Task Due Soon'), ('task_overdue', 'Task Overdue'), ('task_status_changed', 'Task Status Changed'), ('task_priority_changed', 'Task Priority Changed'), ('task_dependency_added', 'Task Dependency Added'), ('task_dependency_completed', 'Task Dependency Completed'), ('project_updated', 'Project Updated'), ('project_member_added', 'Project Member Added'), ('project_member_removed', 'Project Member Removed'), ('project_status_changed', 'Project Status Changed'), ('team_member_added', 'Team Member Added'), ('team_member_removed', 'Team Member Removed'), ('comment_added', 'Comment Added'), ('attachment_added', 'Attachment Added'), ('welcome', 'Welcome'), ('system', 'System Notification')], help_text='Type of notification', max_length=50),
+        ),
+    ]
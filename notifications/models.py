@@ -5,12 +5,40 @@ This module defines the Notification model for managing user notifications
 across the task management application.
 """
 
-from django.db import models
+import logging
+from types import MappingProxyType
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Count, Q
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
+from django.utils.encoding import force_str
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# How long (seconds) a user's notification counts are served from the cache.
+# Writes made through this model invalidate them immediately; the TTL bounds
+# staleness from paths that bypass it (e.g. cleanup's queryset.delete()).
+COUNTS_CACHE_TTL = 60
+
+
+def _counts_cache_key(user_id):
+    """Cache key for a user's unread/total notification counts."""
+    return f'notifications:counts:{user_id}'
+
+
+def _delete_count_keys(keys):
+    """Delete cached count keys, logging instead of raising if Redis is down."""
+    try:
+        cache.delete_many(keys)
+    except RedisError as e:
+        logger.warning("Could not invalidate notification counts: %s", e)
 
 
 class Notification(models.Model):
@@ -52,7 +80,8 @@ class Notification(models.Model):
     TYPE_WELCOME = 'welcome'
     TYPE_SYSTEM = 'system'
     
-    TYPE_CHOICES = [
+    # A tuple: the choices never change at runtime
+    TYPE_CHOICES = (
         # Task-related notifications
         (TYPE_TASK_ASSIGNED, _('Task Assigned')),
         (TYPE_TASK_COMPLETED, _('Task Completed')),
@@ -81,7 +110,10 @@ class Notification(models.Model):
         # System notifications
         (TYPE_WELCOME, _('Welcome')),
         (TYPE_SYSTEM, _('System Notification')),
-    ]
+    )
+    
+    # Rows per UPDATE in mark_all_as_read
+    MARK_ALL_BATCH_SIZE = 5000
     
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -99,13 +131,11 @@ class Notification(models.Model):
     type = models.CharField(
         max_length=50,
         choices=TYPE_CHOICES,
-        db_index=True,
         help_text=_('Type of notification')
     )
     
     read = models.BooleanField(
         default=False,
-        db_index=True,
         help_text=_('Whether the notification has been read')
     )
     
@@ -155,6 +185,8 @@ class Notification(models.Model):
         ordering = ['-created_at']
         verbose_name = _('Notification')
         verbose_name_plural = _('Notifications')
+        # `type` and `read` have no single-column indexes: the composite
+        # indexes leading with them below serve those lookups
         indexes = [
             models.Index(fields=['user', 'read']),
             models.Index(fields=['user', 'type']),
@@ -168,6 +200,17 @@ class Notification(models.Model):
         read_status = _('Read') if self.read else _('Unread')
         return f"{self.get_type_display()} - {self.user.username} ({read_status})"
     
+    def save(self, *args, **kwargs):
+        """Save the notification and drop the recipient's cached counts."""
+        super().save(*args, **kwargs)
+        Notification.invalidate_counts([self.user_id])
+    
+    def delete(self, *args, **kwargs):
+        """Delete the notification and drop the recipient's cached counts."""
+        result = super().delete(*args, **kwargs)
+        Notification.invalidate_counts([self.user_id])
+        return result
+    
     def mark_as_read(self):
         """
         Mark the notification as read.
@@ -208,6 +251,22 @@ class Notification(models.Model):
         """
         return self.read
     
+    def get_age(self, now=None):
+        """
+        Get the age of the notification in whole days and hours.
+        
+        Both values come from a single subtraction, so callers needing
+        both don't read the clock twice.
+        
+        Args:
+            now: Reference time (default: timezone.now())
+            
+        Returns:
+            tuple: (days, hours) since notification was created
+        """
+        time_diff = (now or timezone.now()) - self.created_at
+        return time_diff.days, int(time_diff.total_seconds() / 3600)
+    
     def get_age_in_days(self):
         """
         Get the age of the notification in days.
@@ -215,8 +274,7 @@ class Notification(models.Model):
         Returns:
             int: Number of days since notification was created
         """
-        time_diff = timezone.now() - self.created_at
-        return time_diff.days
+        return self.get_age()[0]
     
     def get_age_in_hours(self):
         """
@@ -225,8 +283,7 @@ class Notification(models.Model):
         Returns:
             int: Number of hours since notification was created
         """
-        time_diff = timezone.now() - self.created_at
-        return int(time_diff.total_seconds() / 3600)
+        return self.get_age()[1]
     
     def is_recent(self, hours=24):
         """
@@ -247,28 +304,7 @@ class Notification(models.Model):
         Returns:
             str: CSS class name for notification type
         """
-        type_classes = {
-            self.TYPE_TASK_ASSIGNED: 'task-assigned',
-            self.TYPE_TASK_COMPLETED: 'task-completed',
-            self.TYPE_TASK_UPDATED: 'task-updated',
-            self.TYPE_TASK_DUE_SOON: 'task-due-soon',
-            self.TYPE_TASK_OVERDUE: 'task-overdue',
-            self.TYPE_TASK_STATUS_CHANGED: 'task-status-changed',
-            self.TYPE_TASK_PRIORITY_CHANGED: 'task-priority-changed',
-            self.TYPE_PROJECT_UPDATED: 'project-updated',
-            self.TYPE_PROJECT_MEMBER_ADDED: 'project-member-added',
-            self.TYPE_PROJECT_MEMBER_REMOVED: 'project-member-removed',
-            self.TYPE_PROJECT_STATUS_CHANGED: 'project-status-changed',
-            self.TYPE_TEAM_MEMBER_ADDED: 'team-member-added',
-            self.TYPE_TEAM_MEMBER_REMOVED: 'team-member-removed',
-            self.TYPE_COMMENT_ADDED: 'comment-added',
-            self.TYPE_ATTACHMENT_ADDED: 'attachment-added',
-            self.TYPE_TASK_DEPENDENCY_ADDED: 'task-dependency-added',
-            self.TYPE_TASK_DEPENDENCY_COMPLETED: 'task-dependency-completed',
-            self.TYPE_WELCOME: 'welcome',
-            self.TYPE_SYSTEM: 'system',
-        }
-        return type_classes.get(self.type, '')
+        return _TYPE_CLASSES.get(self.type, '')
     
     def get_icon(self):
         """
@@ -277,28 +313,39 @@ class Notification(models.Model):
         Returns:
             str: Icon name based on notification type
         """
-        icon_map = {
-            self.TYPE_TASK_ASSIGNED: 'assignment',
-            self.TYPE_TASK_COMPLETED: 'check_circle',
-            self.TYPE_TASK_UPDATED: 'update',
-            self.TYPE_TASK_DUE_SOON: 'schedule',
-            self.TYPE_TASK_OVERDUE: 'warning',
-            self.TYPE_TASK_STATUS_CHANGED: 'swap_horiz',
-            self.TYPE_TASK_PRIORITY_CHANGED: 'priority_high',
-            self.TYPE_PROJECT_UPDATED: 'folder',
-            self.TYPE_PROJECT_MEMBER_ADDED: 'person_add',
-            self.TYPE_PROJECT_MEMBER_REMOVED: 'person_remove',
-            self.TYPE_PROJECT_STATUS_CHANGED: 'change_circle',
-            self.TYPE_TEAM_MEMBER_ADDED: 'group_add',
-            self.TYPE_TEAM_MEMBER_REMOVED: 'group_remove',
-            self.TYPE_COMMENT_ADDED: 'comment',
-            self.TYPE_ATTACHMENT_ADDED: 'attach_file',
-            self.TYPE_TASK_DEPENDENCY_ADDED: 'link',
-            self.TYPE_TASK_DEPENDENCY_COMPLETED: 'link_off',
-            self.TYPE_WELCOME: 'waving_hand',
-            self.TYPE_SYSTEM: 'notifications',
-        }
-        return icon_map.get(self.type, 'notifications')
+        return _TYPE_ICONS.get(self.type, 'notifications')
+    
+    def get_type_display(self):
+        """
+        Get the human-readable label for the notification type.
+        
+        Overrides the method Django generates for ``type``, which rebuilds
+        a dict from TYPE_CHOICES on every call.
+        
+        Returns:
+            str: Translated notification type label
+        """
+        return force_str(_TYPE_LABELS.get(self.type, self.type), strings_only=True)
+    
+    @classmethod
+    def related_object_prefetch(cls):
+        """
+        Get a prefetch that loads related objects for a list of notifications.
+        
+        Related objects are fetched with one query per content type instead
+        of one per notification. Tasks and projects also join the project
+        and team that their __str__ reads.
+        
+        Returns:
+            GenericPrefetch: Prefetch for use with prefetch_related()
+        """
+        from projects.models import Project
+        from tasks.models import Task
+        
+        return GenericPrefetch('related_object', [
+            Task.objects.select_related('project'),
+            Project.objects.select_related('team'),
+        ])
     
     @classmethod
     def get_unread_count(cls, user):
@@ -311,21 +358,92 @@ class Notification(models.Model):
         Returns:
             int: Number of unread notifications
         """
-        return cls.objects.filter(user=user, read=False).count()
+        return cls.get_counts(user)['unread_count']
+    
+    @classmethod
+    def get_counts(cls, user):
+        """
+        Get the unread and total notification counts for a user.
+        
+        Both counts come from one aggregate query, cached per user since
+        clients poll them. The database is used directly if the cache is
+        unavailable.
+        
+        Args:
+            user: User instance
+            
+        Returns:
+            dict: ``unread_count`` and ``total_count``
+        """
+        key = _counts_cache_key(user.pk)
+        try:
+            counts = cache.get(key)
+        except RedisError as e:
+            logger.warning("Notification count cache unavailable: %s", e)
+            counts = None
+        if counts is not None:
+            return counts
+        
+        counts = cls.objects.filter(user=user).aggregate(
+            unread_count=Count('id', filter=Q(read=False)),
+            total_count=Count('id'),
+        )
+        try:
+            cache.set(key, counts, COUNTS_CACHE_TTL)
+        except RedisError as e:
+            logger.warning("Notification count cache unavailable: %s", e)
+        return counts
+    
+    @classmethod
+    def invalidate_counts(cls, user_ids):
+        """
+        Drop the cached notification counts of the given users.
+        
+        The keys are deleted once the surrounding transaction commits (or
+        immediately in autocommit), so a concurrent request can't re-cache
+        counts read before the change was visible.
+        
+        Args:
+            user_ids: Iterable of user IDs whose notifications changed
+        """
+        keys = [_counts_cache_key(user_id) for user_id in user_ids]
+        if keys:
+            transaction.on_commit(lambda: _delete_count_keys(keys))
     
     @classmethod
     def mark_all_as_read(cls, user):
         """
         Mark all notifications as read for a user.
         
+        Fewer unread rows than MARK_ALL_BATCH_SIZE are updated with a single
+        UPDATE. Larger backlogs are updated in primary-key batches so they
+        don't hold row locks in one long UPDATE.
+        
         Args:
             user: User instance
+            
+        Returns:
+            int: Number of notifications marked as read
         """
         now = timezone.now()
-        cls.objects.filter(user=user, read=False).update(
-            read=True,
-            read_at=now
-        )
+        unread = cls.objects.filter(user=user, read=False)
+        if unread.count() < cls.MARK_ALL_BATCH_SIZE:
+            updated = unread.update(read=True, read_at=now)
+            cls.invalidate_counts([user.pk])
+            return updated
+        updated = 0
+        while True:
+            pks = list(unread.order_by('pk').values_list('pk', flat=True)[:cls.MARK_ALL_BATCH_SIZE])
+            if not pks:
+                break
+            updated += cls.objects.filter(pk__in=pks, read=False).update(
+                read=True,
+                read_at=now
+            )
+            if len(pks) < cls.MARK_ALL_BATCH_SIZE:
+                break
+        cls.invalidate_counts([user.pk])
+        return updated
     
     @classmethod
     def create_notification(cls, user, message, notification_type, related_object=None, metadata=None):
@@ -355,3 +473,92 @@ class Notification(models.Model):
         
         notification.save()
         return notification
+    
+    @classmethod
+    def create_notifications_bulk(cls, users, message, notification_type, related_object=None, metadata=None):
+        """
+        Create the same notification for several users at once.
+        
+        The related object's content type is resolved once and all rows are
+        written with bulk_create, so no post_save signals are sent.
+        
+        Args:
+            users: Iterable of User instances (notification recipients)
+            message: Notification message text
+            notification_type: Type of notification (use TYPE_* constants)
+            related_object: Optional related object (Task, Project, etc.)
+            metadata: Optional dictionary with additional metadata
+            
+        Returns:
+            list: Created notification instances
+        """
+        content_type = None
+        related_object_id = None
+        if related_object:
+            content_type = ContentType.objects.get_for_model(related_object)
+            related_object_id = related_object.pk
+        
+        notifications = [
+            cls(
+                user=user,
+                message=message,
+                type=notification_type,
+                metadata=metadata,
+                related_content_type=content_type,
+                related_object_id=related_object_id
+            )
+            for user in users
+        ]
+        created = cls.objects.bulk_create(notifications, batch_size=1000)
+        cls.invalidate_counts({user.pk for user in users})
+        return created
+
+
+# Read-only notification type -> CSS class map, built once instead of on every call
+_TYPE_CLASSES = MappingProxyType({
+    Notification.TYPE_TASK_ASSIGNED: 'task-assigned',
+    Notification.TYPE_TASK_COMPLETED: 'task-completed',
+    Notification.TYPE_TASK_UPDATED: 'task-updated',
+    Notification.TYPE_TASK_DUE_SOON: 'task-due-soon',
+    Notification.TYPE_TASK_OVERDUE: 'task-overdue',
+    Notification.TYPE_TASK_STATUS_CHANGED: 'task-status-changed',
+    Notification.TYPE_TASK_PRIORITY_CHANGED: 'task-priority-changed',
+    Notification.TYPE_PROJECT_UPDATED: 'project-updated',
+    Notification.TYPE_PROJECT_MEMBER_ADDED: 'project-member-added',
+    Notification.TYPE_PROJECT_MEMBER_REMOVED: 'project-member-removed',
+    Notification.TYPE_PROJECT_STATUS_CHANGED: 'project-status-changed',
+    Notification.TYPE_TEAM_MEMBER_ADDED: 'team-member-added',
+    Notification.TYPE_TEAM_MEMBER_REMOVED: 'team-member-removed',
+    Notification.TYPE_COMMENT_ADDED: 'comment-added',
+    Notification.TYPE_ATTACHMENT_ADDED: 'attachment-added',
+    Notification.TYPE_TASK_DEPENDENCY_ADDED: 'task-dependency-added',
+    Notification.TYPE_TASK_DEPENDENCY_COMPLETED: 'task-dependency-completed',
+    Notification.TYPE_WELCOME: 'welcome',
+    Notification.TYPE_SYSTEM: 'system',
+})
+
+# Read-only notification type -> icon name map, built once instead of on every call
+_TYPE_ICONS = MappingProxyType({
+    Notification.TYPE_TASK_ASSIGNED: 'assignment',
+    Notification.TYPE_TASK_COMPLETED: 'check_circle',
+    Notification.TYPE_TASK_UPDATED: 'update',
+    Notification.TYPE_TASK_DUE_SOON: 'schedule',
+    Notification.TYPE_TASK_OVERDUE: 'warning',
+    Notification.TYPE_TASK_STATUS_CHANGED: 'swap_horiz',
+    Notification.TYPE_TASK_PRIORITY_CHANGED: 'priority_high',
+    Notification.TYPE_PROJECT_UPDATED: 'folder',
+    Notification.TYPE_PROJECT_MEMBER_ADDED: 'person_add',
+    Notification.TYPE_PROJECT_MEMBER_REMOVED: 'person_remove',
+    Notification.TYPE_PROJECT_STATUS_CHANGED: 'change_circle',
+    Notification.TYPE_TEAM_MEMBER_ADDED: 'group_add',
+    Notification.TYPE_TEAM_MEMBER_REMOVED: 'group_remove',
+    Notification.TYPE_COMMENT_ADDED: 'comment',
+    Notification.TYPE_ATTACHMENT_ADDED: 'attach_file',
+    Notification.TYPE_TASK_DEPENDENCY_ADDED: 'link',
+    Notification.TYPE_TASK_DEPENDENCY_COMPLETED: 'link_off',
+    Notification.TYPE_WELCOME: 'waving_hand',
+    Notification.TYPE_SYSTEM: 'notifications',
+})
+
+# Read-only notification type -> label map, built once instead of on every call
+_TYPE_LABELS = MappingProxyType(dict(Notification.TYPE_CHOICES))
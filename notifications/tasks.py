@@ -25,9 +25,10 @@ Notification creation tasks:
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 from django.core.mail import send_mail, EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.conf import settings
 from django.utils import timezone
 from celery import shared_task
@@ -39,6 +40,32 @@ from projects.models import Project
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_template(template_name: str):
+    """
+    Load an email template once per worker process.
+    
+    Django's cached loader already keeps parsed templates, but each
+    render_to_string() still goes through engine and loader lookups;
+    holding the Template object skips them on every send.
+    """
+    return get_template(template_name)
+
+
+def render_email(template_name: str, context: dict) -> str:
+    """
+    Render an email template with the given context.
+    
+    Args:
+        template_name: Template path (e.g., 'notifications/emails/welcome.txt')
+        context: Template context dictionary
+        
+    Returns:
+        str: Rendered template
+    """
+    return _get_template(template_name).render(context)
+
+
 def should_send_email(user: User) -> bool:
     """
     Check if email should be sent to user based on their preferences.
@@ -136,8 +163,8 @@ def send_task_assignment_email(
         
         # Render email templates
         subject = f"New Task Assigned: {task.title}"
-        text_message = render_to_string('notifications/emails/task_assignment.txt', context)
-        html_message = render_to_string('notifications/emails/task_assignment.html', context)
+        text_message = render_email('notifications/emails/task_assignment.txt', context)
+        html_message = render_email('notifications/emails/task_assignment.html', context)
         
         # Send email
         from_email = settings.DEFAULT_FROM_EMAIL
@@ -262,8 +289,8 @@ def send_task_due_reminder(
         else:
             subject = f"Reminder: Task Due Soon - {task.title}"
         
-        text_message = render_to_string('notifications/emails/task_due_reminder.txt', context)
-        html_message = render_to_string('notifications/emails/task_due_reminder.html', context)
+        text_message = render_email('notifications/emails/task_due_reminder.txt', context)
+        html_message = render_email('notifications/emails/task_due_reminder.html', context)
         
         # Send email
         from_email = settings.DEFAULT_FROM_EMAIL
@@ -366,8 +393,8 @@ def send_project_update_email(
         
         # Render email templates
         subject = f"Project Update: {project.name}"
-        text_message = render_to_string('notifications/emails/project_update.txt', context)
-        html_message = render_to_string('notifications/emails/project_update.html', context)
+        text_message = render_email('notifications/emails/project_update.txt', context)
+        html_message = render_email('notifications/emails/project_update.html', context)
         
         # Send email
         from_email = settings.DEFAULT_FROM_EMAIL
@@ -460,8 +487,8 @@ def send_welcome_email(self, user_id: int) -> dict:
         
         # Render email templates
         subject = f"Welcome to {context['site_name']}!"
-        text_message = render_to_string('notifications/emails/welcome.txt', context)
-        html_message = render_to_string('notifications/emails/welcome.html', context)
+        text_message = render_email('notifications/emails/welcome.txt', context)
+        html_message = render_email('notifications/emails/welcome.html', context)
         
         # Send email
         from_email = settings.DEFAULT_FROM_EMAIL
@@ -720,35 +747,25 @@ def send_bulk_notifications(
                 # Continue without related object
         
         # Get all users at once for efficiency
-        users = User.objects.filter(id__in=user_ids)
-        existing_user_ids = set(users.values_list('id', flat=True))
+        users = list(User.objects.filter(id__in=user_ids).only('id'))
+        existing_user_ids = {user.id for user in users}
         missing_user_ids = set(user_ids) - existing_user_ids
         
         if missing_user_ids:
             logger.warning(f"Some user IDs not found: {missing_user_ids}")
         
-        created_count = 0
-        failed_count = 0
-        
-        # Create notifications for each user
-        for user in users:
-            try:
-                notification = Notification.create_notification(
-                    user=user,
-                    message=message,
-                    notification_type=notification_type,
-                    related_object=related_object,
-                    metadata=metadata
-                )
-                created_count += 1
-                logger.debug(f"Notification created for user {user.username} (ID: {user.id})")
-            except Exception as e:
-                failed_count += 1
-                logger.error(f"Failed to create notification for user {user.id}: {e}", exc_info=True)
-                # Continue with other users even if one fails
+        # Create all notifications in one INSERT per batch
+        notifications = Notification.create_notifications_bulk(
+            users=users,
+            message=message,
+            notification_type=notification_type,
+            related_object=related_object,
+            metadata=metadata
+        )
+        created_count = len(notifications)
         
         # Count missing users as failed
-        failed_count += len(missing_user_ids)
+        failed_count = len(missing_user_ids)
         
         logger.info(
             f"Bulk notifications completed: {created_count} created, "
@@ -822,8 +839,35 @@ def send_daily_reminders(self) -> dict:
         today_end = today_start + timedelta(days=1)
         tomorrow_end = today_end + timedelta(days=1)
         
-        # Get all active users
-        users = User.objects.filter(is_active=True)
+        # Active users who want email; profiles are joined so
+        # should_send_email doesn't query once per user
+        users = [
+            user for user in User.objects.filter(is_active=True).select_related('profile')
+            if should_send_email(user)
+        ]
+        recipient_ids = {user.id for user in users}
+        
+        # Every open task due before the end of tomorrow, in one query,
+        # bucketed per assignee into (due today, overdue, upcoming)
+        open_tasks = Task.objects.filter(
+            assignee__is_active=True,
+            status__in=[Task.STATUS_TODO, Task.STATUS_IN_PROGRESS, Task.STATUS_BLOCKED],
+            due_date__lt=tomorrow_end
+        ).select_related('project').only(
+            'title', 'due_date', 'assignee', 'project', 'project__name'
+        )
+        buckets = {}
+        for task in open_tasks:
+            if task.assignee_id not in recipient_ids:
+                continue
+            tasks_today, overdue, upcoming = buckets.setdefault(task.assignee_id, ([], [], []))
+            if task.due_date < today_start:
+                overdue.append(task)
+            elif task.due_date < today_end:
+                tasks_today.append(task)
+            else:
+                upcoming.append(task)
+        
         total_users_notified = 0
         tasks_due_today = 0
         overdue_tasks = 0
@@ -831,47 +875,21 @@ def send_daily_reminders(self) -> dict:
         errors = 0
         
         for user in users:
+            # Only send email if user has relevant tasks
+            if user.id not in buckets:
+                continue
+            tasks_today, overdue, upcoming = buckets[user.id]
+            
             try:
-                # Skip if email notifications disabled
-                if not should_send_email(user):
-                    continue
-                
-                # Get user's tasks
-                user_tasks = Task.objects.filter(
-                    assignee=user,
-                    status__in=[Task.STATUS_TODO, Task.STATUS_IN_PROGRESS, Task.STATUS_BLOCKED]
-                ).select_related('project')
-                
-                # Tasks due today
-                tasks_today = user_tasks.filter(
-                    due_date__gte=today_start,
-                    due_date__lt=today_end
-                )
-                
-                # Overdue tasks
-                overdue = user_tasks.filter(
-                    due_date__lt=today_start
-                )
-                
-                # Upcoming tasks (due tomorrow or day after)
-                upcoming = user_tasks.filter(
-                    due_date__gte=today_end,
-                    due_date__lt=tomorrow_end
-                )
-                
-                # Only send email if user has relevant tasks
-                if not (tasks_today.exists() or overdue.exists() or upcoming.exists()):
-                    continue
-                
                 # Prepare email context
                 context = {
                     'user': user,
-                    'tasks_due_today': list(tasks_today),
-                    'overdue_tasks': list(overdue),
-                    'upcoming_tasks': list(upcoming),
-                    'total_tasks_due_today': tasks_today.count(),
-                    'total_overdue': overdue.count(),
-                    'total_upcoming': upcoming.count(),
+                    'tasks_due_today': tasks_today,
+                    'overdue_tasks': overdue,
+                    'upcoming_tasks': upcoming,
+                    'total_tasks_due_today': len(tasks_today),
+                    'total_overdue': len(overdue),
+                    'total_upcoming': len(upcoming),
                     'site_name': getattr(settings, 'SITE_NAME', 'Task Management System'),
                     'support_email': getattr(settings, 'SUPPORT_EMAIL', settings.DEFAULT_FROM_EMAIL),
                     'dashboard_url': f"{getattr(settings, 'FRONTEND_URL', 'http://localhost:3000')}/dashboard",
@@ -879,19 +897,19 @@ def send_daily_reminders(self) -> dict:
                 
                 # Render email templates (we'll create these)
                 subject = f"Daily Task Reminder - {context['total_tasks_due_today'] + context['total_overdue']} tasks need attention"
-                text_message = render_to_string('notifications/emails/daily_reminder.txt', context)
-                html_message = render_to_string('notifications/emails/daily_reminder.html', context)
+                text_message = render_email('notifications/emails/daily_reminder.txt', context)
+                html_message = render_email('notifications/emails/daily_reminder.html', context)
                 
                 # Send email
                 from_email = settings.DEFAULT_FROM_EMAIL
                 send_email_with_html(user.email, subject, text_message, html_message, from_email)
                 
                 total_users_notified += 1
-                tasks_due_today += tasks_today.count()
-                overdue_tasks += overdue.count()
-                upcoming_tasks += upcoming.count()
+                tasks_due_today += len(tasks_today)
+                overdue_tasks += len(overdue)
+                upcoming_tasks += len(upcoming)
                 
-                logger.debug(f"Daily reminder sent to {user.email}: {tasks_today.count()} due today, {overdue.count()} overdue")
+                logger.debug(f"Daily reminder sent to {user.email}: {len(tasks_today)} due today, {len(overdue)} overdue")
                 
             except Exception as e:
                 errors += 1
@@ -1057,8 +1075,8 @@ def send_weekly_digest(self) -> dict:
                 
                 # Render email templates
                 subject = f"Weekly Digest - {context['tasks_completed_count']} tasks completed"
-                text_message = render_to_string('notifications/emails/weekly_digest.txt', context)
-                html_message = render_to_string('notifications/emails/weekly_digest.html', context)
+                text_message = render_email('notifications/emails/weekly_digest.txt', context)
+                html_message = render_email('notifications/emails/weekly_digest.html', context)
                 
                 # Send email
                 from_email = settings.DEFAULT_FROM_EMAIL
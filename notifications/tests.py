@@ -10,7 +10,7 @@ from django.utils import timezone
 from datetime import timedelta
 
 from notifications.models import Notification
-from factories import NotificationFactory, UserFactory
+from factories import NotificationFactory, TaskFactory, UserFactory
 
 
 # ============================================================================
@@ -128,6 +128,25 @@ class TestNotificationListAPI:
         assert response.status_code == 200
         notification_ids = [n['id'] for n in response.data]
         assert notification1.id in notification_ids
+    
+    def test_list_notifications_related_objects_batched(
+        self, authenticated_api_client, user, django_assert_max_num_queries
+    ):
+        """Test related objects are loaded per content type, not per notification."""
+        for task in TaskFactory.create_batch(5):
+            Notification.create_notification(
+                user=user,
+                message='Task assigned to you',
+                notification_type=Notification.TYPE_TASK_ASSIGNED,
+                related_object=task
+            )
+        
+        url = '/api/notifications/'
+        with django_assert_max_num_queries(5):
+            response = authenticated_api_client.get(url)
+        
+        assert response.status_code == 200
+        assert all(n['related_object'] for n in response.data['results'])
 
 
 @pytest.mark.django_db
@@ -253,6 +272,18 @@ class TestNotificationMarkAllReadAPI:
         assert response.status_code == 200
         assert response.data['marked_count'] == 0
     
+    def test_mark_all_notifications_read_in_batches(self, authenticated_api_client, user, monkeypatch):
+        """Test unread backlogs larger than one batch are fully marked as read."""
+        monkeypatch.setattr(Notification, 'MARK_ALL_BATCH_SIZE', 2)
+        NotificationFactory.create_batch(5, user=user, read=False)
+        
+        url = '/api/notifications/mark-all-read/'
+        response = authenticated_api_client.post(url)
+        
+        assert response.status_code == 200
+        assert response.data['marked_count'] == 5
+        assert not Notification.objects.filter(user=user, read=False).exists()
+    
     def test_mark_all_notifications_read_unauthenticated(self, api_client, user):
         """Test marking all notifications as read fails when unauthenticated."""
         url = '/api/notifications/mark-all-read/'
@@ -301,6 +332,31 @@ class TestNotificationCountAPI:
         assert response.data['unread_count'] == 1
         assert response.data['total_count'] == 1
     
+    def test_get_notification_count_updates_after_changes(self, authenticated_api_client, user,
+                                                          django_capture_on_commit_callbacks):
+        """Test cached counts are invalidated once notification changes commit."""
+        notification = NotificationFactory(user=user, read=False)
+        url = '/api/notifications/count/'
+        
+        response = authenticated_api_client.get(url)
+        assert response.data['unread_count'] == 1
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            notification.mark_as_read()
+        response = authenticated_api_client.get(url)
+        assert response.data['unread_count'] == 0
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationFactory(user=user, read=False)
+        response = authenticated_api_client.get(url)
+        assert response.data['unread_count'] == 1
+        assert response.data['total_count'] == 2
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_api_client.post('/api/notifications/mark-all-read/')
+        response = authenticated_api_client.get(url)
+        assert response.data['unread_count'] == 0
+    
     def test_get_notification_count_unauthenticated(self, api_client):
         """Test getting notification counts fails when unauthenticated."""
         url = '/api/notifications/count/'
@@ -15,6 +15,7 @@ from .models import Notification
 from .serializers import (
     NotificationSerializer,
     NotificationMarkReadSerializer,
+    NotificationCountSerializer,
 )
 
 
@@ -72,8 +73,11 @@ class NotificationListView(generics.ListAPIView):
         if type_param:
             queryset = queryset.filter(type=type_param)
         
-        # Optimize queries with select_related for foreign keys
-        queryset = queryset.select_related('user', 'related_content_type')
+        # Optimize queries with select_related for foreign keys, and load
+        # related objects per content type instead of per notification
+        queryset = queryset.select_related('user', 'related_content_type').prefetch_related(
+            Notification.related_object_prefetch()
+        )
         
         return queryset
 
@@ -170,18 +174,13 @@ class NotificationMarkAllReadView(APIView):
         Returns:
             Response: JSON response with success message and count
         """
-        user = request.user
-        
-        # Get count of unread notifications before marking
-        unread_count = Notification.get_unread_count(user)
-        
-        # Mark all notifications as read
-        Notification.mark_all_as_read(user)
+        # Mark all notifications as read; the UPDATE reports how many changed
+        marked_count = Notification.mark_all_as_read(request.user)
         
         return Response(
             {
                 'message': 'All notifications marked as read',
-                'marked_count': unread_count
+                'marked_count': marked_count
             },
             status=status.HTTP_200_OK
         )
@@ -232,19 +231,11 @@ class NotificationCountView(APIView):
         Returns:
             Response: JSON response with unread and total counts
         """
-        user = request.user
+        # Unread and total counts in a single query
+        counts = Notification.get_counts(request.user)
+        serializer = NotificationCountSerializer(counts)
         
-        # Get counts
-        unread_count = Notification.get_unread_count(user)
-        total_count = Notification.objects.filter(user=user).count()
-        
-        return Response(
-            {
-                'unread_count': unread_count,
-                'total_count': total_count
-            },
-            status=status.HTTP_200_OK
-        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 @extend_schema(
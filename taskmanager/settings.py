@@ -99,6 +99,9 @@ DATABASES = {
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
             'charset': 'utf8mb4',
+            # Bound connection attempts so a hung MySQL fails fast (health
+            # probes included) instead of blocking a worker indefinitely
+            'connect_timeout': env.int('MYSQL_CONNECT_TIMEOUT', default=2),
         },
         'CONN_MAX_AGE': 600,  # Connection pooling
     }
@@ -108,13 +111,38 @@ DATABASES = {
 # Use SQLite for faster test execution (in-memory database)
 # This is detected automatically by pytest-django, but we can also set it explicitly
 # Pytest-django will override this with its own test database settings if needed
+# Under pytest-xdist every worker process opens its own in-memory database, so
+# no per-worker TEST NAME template (e.g. 'test_{}') is needed to isolate them
 import sys
-if 'test' in sys.argv or 'pytest' in sys.modules or os.environ.get('PYTEST_CURRENT_TEST'):
+TESTING = 'test' in sys.argv or 'pytest' in sys.modules or bool(os.environ.get('PYTEST_CURRENT_TEST'))
+if TESTING:
     DATABASES['default'] = {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': ':memory:',
     }
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Redis is shared by all gunicorn workers, so cached values (e.g. notification
+# counts) stay consistent across processes. Tests use a local-memory cache.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': env('REDIS_URL', default='redis://redis:6379/0'),
+        'KEY_PREFIX': 'taskmanager',
+        # Fail fast so an unreachable Redis falls back to the database
+        # instead of stalling the request
+        'OPTIONS': {
+            'socket_connect_timeout': 1.0,
+            'socket_timeout': 1.0,
+        },
+    }
+}
+if TESTING:
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -291,6 +319,14 @@ CORS_ALLOW_HEADERS = [
     'x-requested-with',
 ]
 
+# ============================================================================
+# Health Check Configuration
+# ============================================================================
+# How long (seconds) the /health/ aggregate result is reused before the
+# database and Redis are probed again. Absorbs bursts from load balancers,
+# Docker HEALTHCHECK and Kubernetes probes hitting the endpoint together.
+HEALTHCHECK_CACHE_TTL = env.float('HEALTHCHECK_CACHE_TTL', default=1.0)
+
 # ============================================================================
 # Celery Configuration
 # ============================================================================
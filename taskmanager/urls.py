@@ -20,10 +20,10 @@ from core.jwt_views import (
     TokenBlacklistView,
 )
 from core.views import (
-    health_check,  # Backward compatibility
     HealthCheckView,
     DatabaseHealthCheckView,
     RedisHealthCheckView,
+    LivenessView,
 )
 
 urlpatterns = [
@@ -33,6 +33,8 @@ urlpatterns = [
     # Individual service health checks
     path('health/db/', DatabaseHealthCheckView.as_view(), name='health-db'),
     path('health/redis/', RedisHealthCheckView.as_view(), name='health-redis'),
+    # Liveness probe (no dependency checks)
+    path('health/live/', LivenessView.as_view(), name='health-live'),
     
     # Admin
     path('admin/', admin.site.urls),